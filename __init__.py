@@ -1,9 +1,42 @@
 """
 This package contains commons operation with graphs
 """
+import importlib
 
-from adt.graph.core import Node
-from adt.graph.implementations import AdjacencyMatrixGraph, AdjacencyListGraph
+from adt.graph.core import Node, SlottedNode
+from adt.graph.implementations import AdjacencyListGraph
 from adt.graph.functions import *
+from adt.graph.traversal import bfs, dfs, connected_components
+
+# the attributes that need NumPy are imported the first time they are used, with the modules that define them
+_LAZY_ATTRIBUTES = {
+    'AdjacencyMatrixGraph': 'adt.graph.implementations',
+    'CSRGraph': 'adt.graph.implementations',
+}
+_LAZY_MODULES = ('vectorized', 'parallel', 'persistence')
+
+__all__ = ['Node', 'SlottedNode', 'AdjacencyListGraph', 'AdjacencyMatrixGraph', 'CSRGraph',
+           'is_connected_graph', 'same_component', 'num_components', 'shortest_path', 'shortest_path_tree',
+           'bidirectional_shortest_path', 'astar_path', 'euclidean_heuristic', 'is_dag', 'topological_sort',
+           'approx_vertex_cover', 'approx_weighted_vertex_cover',
+           'bfs', 'dfs', 'connected_components']
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> object:
+    """
+    Imports a lazy attribute or module the first time it is read (PEP 562)
+    """
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    # store the attribute, so the next reads don't call this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_MODULES))
@@ -0,0 +1,4 @@
+"""
+This package contains the benchmarks of the graph implementations and of the functions of the package.
+Run them with: python -m adt.graph.benchmarks --help
+"""
@@ -0,0 +1,3 @@
+from adt.graph.benchmarks.runner import main
+
+main()
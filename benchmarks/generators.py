@@ -0,0 +1,99 @@
+"""
+This module contains seeded generators of synthetic graphs.
+Every generator returns the number of nodes and the list of the edges (node_from, node_to, cost),
+where the nodes are the integers from 0 to the number of nodes - 1.
+"""
+import random
+from typing import List, Tuple
+
+GeneratedGraph = Tuple[int, List[Tuple[int, int, int]]]
+
+
+def erdos_renyi(n_edges: int, seed: int = 0, avg_degree: int = 8) -> GeneratedGraph:
+    """
+    Erdős–Rényi random graph, with edges between uniformly chosen nodes.
+    :param n_edges: the number of edges to generate
+    :param seed: the seed of the random generator
+    :param avg_degree: the average number of edges of a node, used to choose the number of nodes
+    :return: the number of nodes and the edges of the graph
+    """
+    rng = random.Random(seed)
+    n = max(2, 2 * n_edges // avg_degree)
+    return n, [(rng.randrange(n), rng.randrange(n), rng.randint(1, 100)) for _ in range(n_edges)]
+
+
+def grid(n_edges: int, seed: int = 0) -> GeneratedGraph:
+    """
+    Square grid graph, where every node is linked to the right and the bottom neighbors.
+    :param n_edges: the approximate number of edges to generate
+    :param seed: the seed of the random generator, used for the costs
+    :return: the number of nodes and the edges of the graph
+    """
+    rng = random.Random(seed)
+    side = max(2, int((n_edges / 2) ** 0.5))
+    edges = []
+    for i in range(side):
+        for j in range(side):
+            v = i * side + j
+            if j + 1 < side:
+                edges.append((v, v + 1, rng.randint(1, 100)))
+            if i + 1 < side:
+                edges.append((v, v + side, rng.randint(1, 100)))
+    return side * side, edges
+
+
+def power_law(n_edges: int, seed: int = 0, attachment: int = 3) -> GeneratedGraph:
+    """
+    Barabási–Albert preferential attachment graph, whose degrees follow a power law.
+    :param n_edges: the approximate number of edges to generate
+    :param seed: the seed of the random generator
+    :param attachment: the number of edges that every new node adds towards the existing ones
+    :return: the number of nodes and the edges of the graph
+    """
+    rng = random.Random(seed)
+    n = max(attachment + 1, n_edges // attachment)
+    edges = []
+    # every node appears in this list once for each of its edges, so sampling it follows the degrees
+    ends = list(range(attachment))
+    for v in range(attachment, n):
+        targets = {rng.choice(ends) for _ in range(attachment)}
+        for u in targets:
+            edges.append((v, u, rng.randint(1, 100)))
+            ends += [u, v]
+    return n, edges
+
+
+def dag(n_edges: int, seed: int = 0, avg_degree: int = 8) -> GeneratedGraph:
+    """
+    Random directed acyclic graph, where every edge goes from a node to a greater one.
+    :param n_edges: the number of edges to generate
+    :param seed: the seed of the random generator
+    :param avg_degree: the average number of edges of a node, used to choose the number of nodes
+    :return: the number of nodes and the edges of the graph
+    """
+    rng = random.Random(seed)
+    n = max(2, 2 * n_edges // avg_degree)
+    edges = []
+    for _ in range(n_edges):
+        u, v = rng.randrange(n), rng.randrange(n)
+        while u == v:
+            v = rng.randrange(n)
+        edges.append((min(u, v), max(u, v), rng.randint(1, 100)))
+    return n, edges
+
+
+GENERATORS = {
+    'erdos_renyi': erdos_renyi,
+    'grid': grid,
+    'power_law': power_law,
+    'dag': dag,
+}
+
+# the (source, target) of the path benchmarks, as a function of the number of nodes.
+# The edges of a power-law graph go from the newer nodes to the older ones, so its paths start from the last node.
+ENDPOINTS = {
+    'erdos_renyi': lambda n: (0, n - 1),
+    'grid': lambda n: (0, n - 1),
+    'power_law': lambda n: (n - 1, 0),
+    'dag': lambda n: (0, n - 1),
+}
@@ -0,0 +1,50 @@
+"""
+This module measures the cold-start time of the import of the package, each time in a new interpreter,
+and checks that the import doesn't load NumPy.
+"""
+import os
+import subprocess
+import sys
+from typing import List
+
+# the import of the package should stay under this time, far from the tens of milliseconds of NumPy
+DEFAULT_MAX_IMPORT_SECONDS = 0.05
+
+_SCRIPT = '''
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start, 'numpy' in sys.modules)
+'''
+
+
+def measure_import(module: str = 'adt.graph', repeat: int = 5) -> dict:
+    """
+    Measures the import of a module in new interpreters, with the same search path of this one.
+    :param module: the name of the module to import
+    :param repeat: the number of interpreters to start
+    :return: a dict with the module, the seconds of the fastest import and whether the import loaded NumPy
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    best, numpy_loaded = float('inf'), False
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', _SCRIPT.format(module=module)], env=env, capture_output=True,
+                                text=True, check=True).stdout.split()
+        best = min(best, float(output[0]))
+        numpy_loaded = numpy_loaded or output[1] == 'True'
+    return {'module': module, 'seconds': best, 'numpy_loaded': numpy_loaded}
+
+
+def check_import(result: dict, max_seconds: float = DEFAULT_MAX_IMPORT_SECONDS) -> List[str]:
+    """
+    Checks the result of measure_import.
+    :param result: the result to check
+    :param max_seconds: the maximum time of the import
+    :return: the list of the problems found, empty if the import is fine
+    """
+    problems = []
+    if result['numpy_loaded']:
+        problems.append(f"import {result['module']} loads NumPy")
+    if result['seconds'] > max_seconds:
+        problems.append(f"import {result['module']} takes {result['seconds']:.4f} s, more than {max_seconds} s")
+    return problems
@@ -0,0 +1,238 @@
+"""
+This module runs the benchmarks of every graph implementation and every function of the package
+on synthetic graphs of growing size, and writes the results as JSON.
+"""
+import argparse
+import collections
+import datetime
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from adt.graph import functions
+from adt.graph.benchmarks import imports
+from adt.graph.benchmarks.generators import ENDPOINTS, GENERATORS
+from adt.graph.core import Graph
+from adt.graph.implementations import AdjacencyListGraph, AdjacencyMatrixGraph
+from typing import Callable, Iterable, List, Optional
+
+# a benchmark prepares its input with setup(graph_builder, n, edges, endpoints) and measures run(*input),
+# where endpoints is the (source, target) of the paths on the generated graph.
+# Read-only benchmarks can be run also on frozen graphs.
+Benchmark = collections.namedtuple('Benchmark', 'name directed weighted read_only setup run')
+
+BACKENDS = ('list', 'matrix', 'csr')
+DEFAULT_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+# the adjacency matrix needs memory quadratic in the number of nodes, bigger graphs are skipped
+DEFAULT_MAX_MATRIX_NODES = 5000
+N_REMOVED_VERTICES = 100
+
+
+def build_graph(backend: str, n: int, edges: list, *, directed: bool, weighted: bool) -> Graph:
+    """
+    Builds a graph with the given implementation.
+    :param backend: one of 'list', 'matrix' or 'csr'
+    :param n: the number of nodes, the nodes are the integers from 0 to n - 1
+    :param edges: the edges of the graph, as tuples (node_from, node_to, cost)
+    :param directed: true if is a directed graph, false otherwise
+    :param weighted: true if is a weighted graph, false otherwise
+    :return: the new graph
+    """
+    graph = (AdjacencyMatrixGraph if backend == 'matrix' else AdjacencyListGraph)(directed=directed, weighted=weighted)
+    if n:
+        graph.add_vertex(*range(n))
+    graph.add_edges_from(edges)
+    return graph.freeze() if backend == 'csr' else graph
+
+
+def _add_vertices(graph: Graph, n: int) -> None:
+    for v in range(n):
+        graph.add_vertex(v)
+
+
+def _add_edges(graph: Graph, edges: list) -> None:
+    for node_from, node_to, cost in edges:
+        graph.add_edge(node_from, node_to, cost=cost)
+
+
+def _get_edges(graph: Graph, n: int) -> None:
+    for v in range(n):
+        graph.get_edges(v)
+
+
+def _remove_vertices(graph: Graph, nodes: list) -> None:
+    for v in nodes:
+        graph.remove_vertex(v)
+
+
+BENCHMARKS = (
+    Benchmark('add_vertex', True, True, False,
+              lambda build, n, edges, endpoints: (build(0, []), n), _add_vertices),
+    Benchmark('add_edge', True, True, False,
+              lambda build, n, edges, endpoints: (build(n, []), edges), _add_edges),
+    Benchmark('get_edges', True, True, True,
+              lambda build, n, edges, endpoints: (build(n, edges), n), _get_edges),
+    Benchmark('edges', True, True, True,
+              lambda build, n, edges, endpoints: (build(n, edges),), lambda graph: graph.edges),
+    Benchmark('remove_vertex', True, True, False,
+              lambda build, n, edges, endpoints: (build(n, edges), random.Random(n).sample(range(n), min(n, N_REMOVED_VERTICES))),
+              _remove_vertices),
+    Benchmark('remove_vertices_from', True, True, False,
+              lambda build, n, edges, endpoints: (build(n, edges), random.Random(n).sample(range(n), min(n, N_REMOVED_VERTICES))),
+              lambda graph, nodes: graph.remove_vertices_from(nodes)),
+    Benchmark('shortest_path', True, True, True,
+              lambda build, n, edges, endpoints: (build(n, edges), *endpoints), functions.shortest_path),
+    Benchmark('is_dag', True, False, True,
+              lambda build, n, edges, endpoints: (build(n, edges),), functions.is_dag),
+    Benchmark('is_connected_graph', False, False, True,
+              lambda build, n, edges, endpoints: (build(n, edges),), functions.is_connected_graph),
+    Benchmark('approx_vertex_cover', False, False, True,
+              lambda build, n, edges, endpoints: (build(n, edges),), functions.approx_vertex_cover),
+)
+
+
+def measure(setup: Callable[[], tuple], run: Callable, repeat: int = 3) -> dict:
+    """
+    Measures the time and the peak of allocated memory of a function.
+    The time is the best of repeat runs, the memory is measured in another run, since tracing slows it down.
+    :param setup: the function that builds the input of every run
+    :param run: the function to measure
+    :param repeat: the number of timed runs
+    :return: a dict with the seconds of the fastest run and the peak of allocated bytes
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        args = setup()
+        gc.collect()
+        start = time.perf_counter()
+        run(*args)
+        best = min(best, time.perf_counter() - start)
+    args = setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': best, 'peak_bytes': peak}
+
+
+def run(backends: Iterable[str] = BACKENDS, generators: Iterable[str] = tuple(GENERATORS),
+        sizes: Iterable[int] = DEFAULT_SIZES, benchmarks: Optional[Iterable[str]] = None, *, seed: int = 0,
+        repeat: int = 3, max_matrix_nodes: int = DEFAULT_MAX_MATRIX_NODES,
+        log: Optional[Callable[[str], None]] = None) -> List[dict]:
+    """
+    Runs the benchmarks for every combination of implementation, generator and size.
+    :param backends: the names of the implementations to measure
+    :param generators: the names of the graph generators
+    :param sizes: the numbers of edges of the generated graphs
+    :param benchmarks: the names of the benchmarks to run, all if None
+    :param seed: the seed of the generators
+    :param repeat: the number of timed runs of every benchmark
+    :param max_matrix_nodes: the graphs with more nodes are skipped by the adjacency matrix
+    :param log: a function called with a line of text for every result
+    :return: a list of results, one per benchmark, with the seconds and the peak bytes of allocated memory.
+    The skipped benchmarks have a reason instead.
+    """
+    selected = [b for b in BENCHMARKS if benchmarks is None or b.name in benchmarks]
+    results = []
+    for generator in generators:
+        for size in sizes:
+            n, edges = GENERATORS[generator](size, seed=seed)
+            endpoints = ENDPOINTS[generator](n)
+            for backend in backends:
+                for benchmark in selected:
+                    result = {'backend': backend, 'generator': generator, 'size': size, 'nodes': n,
+                              'edges': len(edges), 'benchmark': benchmark.name}
+                    if backend == 'csr' and not benchmark.read_only:
+                        result['skipped'] = 'read-only graph'
+                    elif backend == 'matrix' and n > max_matrix_nodes:
+                        result['skipped'] = f'more than {max_matrix_nodes} nodes'
+                    else:
+                        def build(n_nodes: int, graph_edges: list, _backend=backend, _benchmark=benchmark) -> Graph:
+                            return build_graph(_backend, n_nodes, graph_edges, directed=_benchmark.directed,
+                                               weighted=_benchmark.weighted)
+                        result.update(measure(lambda: benchmark.setup(build, n, edges, endpoints), benchmark.run, repeat))
+                    results.append(result)
+                    if log is not None:
+                        log(_format(result))
+    return results
+
+
+def _format(result: dict) -> str:
+    """
+    Formats a result as a line of text
+    """
+    case = f"{result['backend']:<6} {result['generator']:<11} {result['edges']:>8} edges  {result['benchmark']:<20}"
+    if 'skipped' in result:
+        return f"{case} skipped: {result['skipped']}"
+    return f"{case} {result['seconds']:>10.4f} s {result['peak_bytes'] / 2 ** 20:>10.2f} MiB"
+
+
+def compare(old: List[dict], new: List[dict]) -> List[dict]:
+    """
+    Compares the results of two runs.
+    :param old: the results of the reference run
+    :param new: the results of the new run
+    :return: the results measured by both runs, with the ratio new / old of their seconds and peak bytes
+    """
+    def key(result: dict) -> tuple:
+        return result['backend'], result['generator'], result['size'], result['benchmark']
+    old_results = {key(r): r for r in old if 'skipped' not in r}
+    comparison = []
+    for r in new:
+        if 'skipped' in r or (o := old_results.get(key(r))) is None:
+            continue
+        comparison.append({**r,
+                           'time_ratio': r['seconds'] / o['seconds'] if o['seconds'] else float('inf'),
+                           'memory_ratio': r['peak_bytes'] / o['peak_bytes'] if o['peak_bytes'] else float('inf')})
+    return comparison
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m adt.graph.benchmarks', description=__doc__)
+    parser.add_argument('--backends', nargs='+', choices=BACKENDS, default=BACKENDS)
+    parser.add_argument('--generators', nargs='+', choices=tuple(GENERATORS), default=tuple(GENERATORS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES, help='numbers of edges')
+    parser.add_argument('--benchmarks', nargs='+', choices=[b.name for b in BENCHMARKS])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-matrix-nodes', type=int, default=DEFAULT_MAX_MATRIX_NODES)
+    parser.add_argument('--output', help='path of the JSON file of the results')
+    parser.add_argument('--compare', help='path of the JSON file of a previous run to compare with')
+    parser.add_argument('--import-time', action='store_true',
+                        help='measure only the cold-start import of the package, failing if it is slow or loads NumPy')
+    parser.add_argument('--max-import-seconds', type=float, default=imports.DEFAULT_MAX_IMPORT_SECONDS)
+    args = parser.parse_args(argv)
+
+    if args.import_time:
+        result = imports.measure_import(repeat=args.repeat)
+        print(f"import {result['module']:<16} {result['seconds']:>10.4f} s  numpy loaded: {result['numpy_loaded']}")
+        if problems := imports.check_import(result, args.max_import_seconds):
+            sys.exit('\n'.join(problems))
+        return
+
+    results = run(args.backends, args.generators, args.sizes, args.benchmarks, seed=args.seed, repeat=args.repeat,
+                  max_matrix_nodes=args.max_matrix_nodes, log=print)
+    report = {
+        'metadata': {
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'python': sys.version,
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)['results']
+        for r in compare(previous, results):
+            print(f"{_format(r)}  time x{r['time_ratio']:.2f}  memory x{r['memory_ratio']:.2f}")
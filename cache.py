@@ -0,0 +1,97 @@
+"""
+This module memoizes the results of the functions on graphs.
+A result is cached together with the version of the graph, so any change of the graph makes it stale.
+"""
+import collections
+import functools
+import threading
+import weakref
+from adt.graph.core import Graph
+from typing import Callable
+
+CacheInfo = collections.namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+
+class QueryCache:
+    """
+    Bounded LRU cache of the results of functions whose first argument is a graph.
+    The key of a result is (function, graph, version of the graph, other arguments), so the arguments must be hashable.
+    The graph is referenced weakly, and the cached results are returned as they are, so they must not be changed.
+    Usage:
+        cache = QueryCache(maxsize=1024)
+        path, cost = cache(shortest_path, graph, a, b)
+    """
+    def __init__(self, maxsize: int = 128):
+        """
+        Instance initializer
+        :param maxsize: the maximum number of cached results, the least recently used ones are evicted first
+        """
+        if maxsize < 0:
+            raise ValueError('maxsize must be positive')
+        self._maxsize = maxsize
+        self._results = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, function: Callable, graph: Graph, *args, **kwargs) -> object:
+        """
+        Gets the result of function(graph, *args, **kwargs), computing it only if it's not in the cache.
+        :param function: the function to call
+        :param graph: the graph passed to the function
+        :return: the result of the function
+        :raises TypeError: if the arguments are not hashable
+        """
+        key = (function, weakref.ref(graph), graph.version, args, frozenset(kwargs.items()))
+        with self._lock:
+            if key in self._results:
+                self._hits += 1
+                self._results.move_to_end(key)
+                return self._results[key]
+            self._misses += 1
+        result = function(graph, *args, **kwargs)
+        with self._lock:
+            self._results[key] = result
+            while len(self._results) > self._maxsize:
+                self._results.popitem(last=False)
+        return result
+
+    def cached(self, function: Callable) -> Callable:
+        """
+        Decorator that caches the results of a function in this cache.
+        :param function: the function to cache, its first argument must be the graph
+        :return: the cached function
+        """
+        @functools.wraps(function)
+        def wrapper(graph: Graph, *args, **kwargs):
+            return self(function, graph, *args, **kwargs)
+        wrapper.cache_info = self.cache_info
+        wrapper.cache_clear = self.cache_clear
+        return wrapper
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Gets the statistics of the cache.
+        :return: the number of hits and misses, the maximum and the current number of cached results
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._results))
+
+    def cache_clear(self) -> None:
+        """
+        Removes all the results and resets the statistics
+        """
+        with self._lock:
+            self._results.clear()
+            self._hits = self._misses = 0
+
+
+def memoize(maxsize: int = 128) -> Callable[[Callable], Callable]:
+    """
+    Decorator that caches the results of a function on graphs in its own QueryCache, like functools.lru_cache.
+    Usage:
+        cached_shortest_path = memoize(maxsize=1024)(shortest_path)
+    :param maxsize: the maximum number of cached results
+    :return: the decorator
+    """
+    return QueryCache(maxsize).cached
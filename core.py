@@ -1,19 +1,22 @@
 import abc
 import collections
-from typing import Set, Union
+import sys
+import adt.graph.util.exceptions as exc
+from adt.graph.util.disjoint_set import DisjointSet
+from typing import FrozenSet, Iterable, Optional, Set, Union
 
 Edge = collections.namedtuple('Edge', 'n_from n_to')
 WeightedEdge = collections.namedtuple('Edge', 'n_from n_to cost')
 
 
-class Node:
+class BaseNode:
 	"""
-	This class models a single item of a graph.
+	This class is the common base of the nodes, it holds only the label and has no instance dictionary.
 	"""
-	def __init__(self, label: object, **kwargs: dict):
+	__slots__ = ('_label',)
+
+	def __init__(self, label: object):
 		self._label = label
-		for varname in kwargs:
-			setattr(self, varname, kwargs[varname])
 
 	@property
 	def label(self) -> object:
@@ -37,7 +40,57 @@ class Node:
 	__repr__ = __str__
 
 
+class Node(BaseNode):
+	"""
+	This class models a single item of a graph.
+	"""
+	def __init__(self, label: object, **kwargs: dict):
+		super().__init__(label)
+		for varname in kwargs:
+			setattr(self, varname, kwargs[varname])
+
+
+class SlottedNode(BaseNode):
+	"""
+	This class models a single item of a graph without an instance dictionary, so it takes less memory than Node.
+	The attributes of the node must be declared by a subclass made with SlottedNode.schema.
+	String labels are interned, so equal labels share the same string.
+	"""
+	__slots__ = ()
+
+	def __init__(self, label: object, **kwargs: dict):
+		super().__init__(sys.intern(label) if type(label) is str else label)
+		for varname in kwargs:
+			setattr(self, varname, kwargs[varname])
+
+	@classmethod
+	def schema(cls, name: str, *fields: str, module: Optional[str] = None) -> type:
+		"""
+		Builds a subclass of this class with a fixed set of attributes.
+		As in collections.namedtuple, the class belongs to the module of the caller, so its nodes can be pickled
+		if the class is bound to the same name at module level.
+		:param name: the name of the new class
+		:param fields: the names of the attributes of the nodes
+		:param module: the module of the new class, the module of the caller if None
+		:return: the new class
+		"""
+		if module is None:
+			try:
+				module = sys._getframe(1).f_globals.get('__name__', '__main__')
+			except (AttributeError, ValueError):
+				module = __name__
+		return type(name, (cls,), {'__slots__': fields, '__module__': module})
+
+
 class Graph(abc.ABC):
+	# the functions called with every new subclass, e.g. to instrument the backends imported lazily
+	_subclass_hooks = []
+
+	def __init_subclass__(cls, **kwargs):
+		super().__init_subclass__(**kwargs)
+		for hook in Graph._subclass_hooks:
+			hook(cls)
+
 	def __init__(self, *, directed: bool = False, weighted: bool = False):
 		"""
 		Instance initializer
@@ -47,6 +100,15 @@ class Graph(abc.ABC):
 		self._prop_directed = directed
 		self._prop_weighted = weighted
 		self._weights = {} if weighted else None
+		# cached views of the vertices and of the edges, built on demand and dropped by every change of the graph
+		self._vertices_view = None
+		self._edges_view = None
+		# the number of changes of the graph
+		self._version = 0
+		# the union-find of the connected components, None if the connectivity index is not enabled.
+		# The additions update it, the removals make it stale until it is read again.
+		self._components = None
+		self._components_stale = False
 
 	@property
 	def is_directed(self) -> bool:
@@ -65,21 +127,111 @@ class Graph(abc.ABC):
 		return self._prop_weighted
 
 	@property
-	def vertices(self) -> Set[Node]:
+	def version(self) -> int:
+		"""
+		Property
+		:return: a counter increased by every change of the graph, if it did not change the graph did not change either
+		"""
+		return self._version
+
+	@property
+	def vertices(self) -> FrozenSet[Node]:
 		"""
 		Property
+		The set is cached until the graph changes, so reading it again costs nothing.
 		:return: the vertices of the graph
 		"""
 		raise NotImplementedError()
 
 	@property
-	def edges(self) -> Set[Union[Edge, WeightedEdge]]:
+	def edges(self) -> FrozenSet[Union[Edge, WeightedEdge]]:
 		"""
 		Property
+		The set is cached until the graph changes, so reading it again costs nothing.
 		:return: the nodes of the graph
 		"""
 		raise NotImplementedError()
 
+	@property
+	def num_edges(self) -> int:
+		"""
+		Property
+		:return: the number of edges of the graph, an undirected edge is counted once
+		"""
+		raise NotImplementedError()
+
+	@property
+	def connectivity_index(self) -> Optional[DisjointSet]:
+		"""
+		Property
+		If a removal made the index stale, it is rebuilt from the whole graph.
+		:return: the union-find of the connected components of the graph, None if the index is not enabled
+		"""
+		if self._components is not None and self._components_stale:
+			self._components = self.__build_components()
+			self._components_stale = False
+		return self._components
+
+	def enable_connectivity_index(self) -> None:
+		"""
+		Enables the connectivity index, a union-find of the connected components that the graph updates at every addition,
+		so that the connectivity queries don't need to visit the graph.
+		A removal can split a component, so the index is rebuilt when it is read after a removal.
+		:raises AttributeError: if the graph is directed.
+		"""
+		if self.is_directed:
+			raise AttributeError('The graph must be undirected.')
+		if self._components is None:
+			self._components = self.__build_components()
+			self._components_stale = False
+
+	def disable_connectivity_index(self) -> None:
+		"""
+		Drops the connectivity index, so the additions don't update it anymore.
+		"""
+		self._components = None
+		self._components_stale = False
+
+	def __build_components(self) -> DisjointSet:
+		"""
+		Builds the union-find of the connected components visiting all the edges of the graph
+		"""
+		components = DisjointSet(self.vertices)
+		for node in self.vertices:
+			for e in self.get_edges(node):
+				components.union(e.n_from, e.n_to)
+		return components
+
+	def _index_vertex(self, node: Node) -> None:
+		"""
+		Must be called by the implementations after the addition of a vertex, it updates the connectivity index
+		"""
+		if self._components is not None and not self._components_stale:
+			self._components.add(node)
+
+	def _index_edge(self, node_from: Node, node_to: Node) -> None:
+		"""
+		Must be called by the implementations after the addition of an edge, it updates the connectivity index
+		"""
+		if self._components is not None and not self._components_stale:
+			self._components.union(node_from, node_to)
+
+	def _index_removal(self) -> None:
+		"""
+		Must be called by the implementations after the removal of a vertex or of an edge,
+		it marks the connectivity index as stale
+		"""
+		self._components_stale = self._components is not None
+
+	def _changed(self) -> None:
+		"""
+		Must be called by the implementations after every change of the graph,
+		it drops the cached views and increases the version.
+		"""
+		self._vertices_view = None
+		self._edges_view = None
+		self._version += 1
+
 	def get_edges(self, node: Node) -> Set[Union[Edge, WeightedEdge]]:
 		"""
 		Returns all the edges of a given node.
@@ -126,6 +278,46 @@ class Graph(abc.ABC):
 		"""
 		raise NotImplementedError()
 
+	def add_edges_from(self, edges: Iterable[tuple]) -> None:
+		"""
+		Adds many edges in the graph. Unlike add_edge, the missing end nodes are added to the graph.
+		:param edges: the edges to add, as tuples (node_from, node_to) or (node_from, node_to, cost).
+		If the cost is missing (or the graph is not weighted) it is the same of add_edge.
+		:return: None
+		"""
+		for node_from, node_to, *cost in edges:
+			for node in (node_from, node_to):
+				try:
+					self.add_vertex(node)
+				except exc.AlreadyInGraph:
+					pass
+			self.add_edge(node_from, node_to, cost=cost[0] if cost else 0)
+
+	@classmethod
+	def from_edge_array(cls, src: Iterable, dst: Iterable, weights: Optional[Iterable] = None, *, directed: bool = False,
+						weighted: Optional[bool] = None, **kwargs) -> 'Graph':
+		"""
+		Builds a graph from the parallel arrays (e.g. NumPy arrays) of the ends and the costs of its edges.
+		The nodes of the graph are the distinct values of src and dst.
+		:param src: the start node of every edge
+		:param dst: the end node of every edge
+		:param weights: the cost of every edge
+		:param directed: true if is a directed graph, false otherwise
+		:param weighted: true if is a weighted graph, false otherwise. By default it is true if weights are given
+		:param kwargs: other arguments of the initializer of the graph
+		:return: the new graph
+		:raises ValueError: if the arrays have different lengths
+		"""
+		weighted = weights is not None if weighted is None else weighted
+		columns = [_to_list(src), _to_list(dst)]
+		if weighted and weights is not None:
+			columns.append(_to_list(weights))
+		if any(len(column) != len(columns[0]) for column in columns):
+			raise ValueError('src, dst and weights must have the same length')
+		graph = cls(directed=directed, weighted=weighted, **kwargs)
+		graph.add_edges_from(zip(*columns))
+		return graph
+
 	def remove_vertex(self, node: Node) -> None:
 		"""
 		Remove a vertex from the graph.
@@ -135,6 +327,37 @@ class Graph(abc.ABC):
 		"""
 		raise NotImplementedError()
 
+	def remove_vertices_from(self, nodes: Iterable[Node]) -> None:
+		"""
+		Removes many vertices from the graph, with all their edges.
+		The vertices that are not in the graph are ignored.
+		:param nodes: the vertices to remove
+		:return: None
+		"""
+		for node in nodes:
+			self.remove_vertex(node)
+
+	def induced_subgraph(self, nodes: Iterable[Node]) -> 'Graph':
+		"""
+		Builds a new graph with the given vertices and all the edges of this graph between them.
+		The vertices that are not in the graph are ignored.
+		:param nodes: the vertices of the subgraph
+		:return: the new graph, of the same kind of this graph
+		"""
+		nodes = [node for node in dict.fromkeys(nodes) if node in self]
+		graph = self._empty_like()
+		if nodes:
+			graph.add_vertex(*nodes)
+		keep = set(nodes)
+		graph.add_edges_from(e for node in nodes for e in self.get_edges(node) if e.n_to in keep)
+		return graph
+
+	def _empty_like(self) -> 'Graph':
+		"""
+		Builds an empty graph of the same kind of this graph, used by induced_subgraph
+		"""
+		return type(self)(directed=self.is_directed, weighted=self.is_weighted)
+
 	def remove_edge(self, edge: tuple) -> bool:
 		"""
 		Removes an edge from the graph.
@@ -145,6 +368,30 @@ class Graph(abc.ABC):
 		"""
 		raise NotImplementedError()
 
+	def freeze(self) -> 'Graph':
+		"""
+		Builds an immutable copy of the graph stored in compressed sparse row arrays.
+		The copy is not affected by later changes of this graph.
+		:return: a CSRGraph with the same vertices and edges of this graph
+		"""
+		from adt.graph.implementations.csr import CSRGraph
+		return CSRGraph.from_graph(self)
+
+	def snapshot(self) -> 'Graph':
+		"""
+		Builds a read-only view of the current state of the graph, that many threads can read without locks
+		while the graph keeps changing. It must be called by the thread that changes the graph.
+		By default the view is the frozen copy of the graph, the implementations can share their storage with it.
+		:return: a read-only graph with the vertices and the edges that this graph has now
+		"""
+		return self.freeze()
+
+	def __len__(self) -> int:
+		return len(self.vertices)
+
+	def __contains__(self, node: object) -> bool:
+		return node in self.vertices
+
 	def __getitem__(self, item):
 		try:
 			return self.get_edges(item)
@@ -157,3 +404,37 @@ class Graph(abc.ABC):
 		return properties + '\n' + state
 
 	__repr__ = __str__
+
+
+class ImmutableGraph(Graph):
+	"""
+	This class is the base of the read-only graphs: every change raises ReadOnlyGraph,
+	and since the graph can't change it is its own snapshot.
+	"""
+	def snapshot(self) -> 'ImmutableGraph':
+		return self
+
+	def add_vertex(self, node: Node, *nodes: Node) -> None:
+		raise exc.ReadOnlyGraph()
+
+	def add_edge(self, node_from: Node, node_to: Node, *nodes_to: Node, cost: object = 0, reverse: bool = False) -> None:
+		raise exc.ReadOnlyGraph()
+
+	def add_edges_from(self, edges: Iterable[tuple]) -> None:
+		raise exc.ReadOnlyGraph()
+
+	def remove_vertex(self, node: Node) -> None:
+		raise exc.ReadOnlyGraph()
+
+	def remove_vertices_from(self, nodes: Iterable[Node]) -> None:
+		raise exc.ReadOnlyGraph()
+
+	def remove_edge(self, edge: tuple) -> bool:
+		raise exc.ReadOnlyGraph()
+
+
+def _to_list(values: Iterable) -> list:
+	"""
+	Converts an array into a list, turning NumPy scalars into Python objects
+	"""
+	return values.tolist() if hasattr(values, 'tolist') else list(values)
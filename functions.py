@@ -1,7 +1,18 @@
+import collections
+import heapq
+import itertools
+import math
 from adt.graph.core import Graph
-from typing import Tuple
+from adt.graph.instrumentation import instrumented
+from adt.graph.traversal import bfs, connected_components
+from typing import Callable, Optional, Tuple
 
+__all__ = ['is_connected_graph', 'same_component', 'num_components', 'shortest_path', 'shortest_path_tree',
+           'bidirectional_shortest_path', 'astar_path', 'euclidean_heuristic', 'is_dag', 'topological_sort',
+           'approx_vertex_cover', 'approx_weighted_vertex_cover']
 
+
+@instrumented
 def is_connected_graph(graph: Graph) -> bool:
     """
     Check if a a is connected.
@@ -11,18 +22,96 @@ def is_connected_graph(graph: Graph) -> bool:
     """
     if graph.is_directed:
         raise AttributeError('The graph must be undirected.')
-    discovered = set()
-    def _driver_connected_graph(n):
-        discovered.add(n)
-        for e in graph.get_edges(n):
-            if e.n_to not in discovered:
-                _driver_connected_graph(e.n_to)
-    if len(vertices := list(graph.vertices)) == 0:
+    if (components := graph.connectivity_index) is not None:
+        return components.num_sets <= 1
+    if len(graph) == 0:
         return True
-    _driver_connected_graph(vertices[0])
-    return len(discovered) == len(graph.vertices)
+    n_reached = sum(1 for _ in bfs(graph, next(iter(graph.vertices))))
+    return n_reached == len(graph)
+
+
+@instrumented
+def same_component(graph: Graph, u: object, v: object) -> bool:
+    """
+    Check if two nodes are in the same connected component.
+    If the connectivity index of the graph is enabled it answers without visiting the graph.
+    :param graph: the graph to check
+    :param u: the first node
+    :param v: the second node
+    :return: True if there is a path between the two nodes, False otherwise
+    :raises AttributeError: if the graph is directed.
+    :raises KeyError: if the graph not contains u or v.
+    """
+    if graph.is_directed:
+        raise AttributeError('The graph must be undirected.')
+    for node in (u, v):
+        if node not in graph:
+            raise KeyError(f"The node {node=} is not in the graph")
+    if (components := graph.connectivity_index) is not None:
+        return components.connected(u, v)
+    return any(node == v for node in bfs(graph, u))
+
+
+@instrumented
+def num_components(graph: Graph) -> int:
+    """
+    Counts the connected components of a graph.
+    If the connectivity index of the graph is enabled it answers without visiting the graph.
+    :param graph: the graph to inspect
+    :return: the number of connected components
+    :raises AttributeError: if the graph is directed.
+    """
+    if graph.is_directed:
+        raise AttributeError('The graph must be undirected.')
+    if (components := graph.connectivity_index) is not None:
+        return components.num_sets
+    return len(set(connected_components(graph).values()))
+
+
+def _dijkstra(graph: Graph, source: object, target: object = None) -> Tuple[dict, dict]:
+    """
+    Binary-heap Dijkstra with lazy deletion: stale heap entries are skipped when popped instead of being updated.
+    :param graph: the graph to inspect
+    :param source: the node from where the algorithm must starts
+    :param target: if given, the search stops as soon as this node is settled
+    :return: a tuple (distances, parents) of the reached nodes, where parents maps a node to the edge used to reach it
+    """
+    distances = {source: 0}
+    parents = {source: None}
+    settled = set()
+    # the counter breaks the ties between equal distances, so nodes never get compared
+    counter = itertools.count()
+    heap = [(0, next(counter), source)]
+    while heap:
+        dist, _, u = heapq.heappop(heap)
+        if u in settled:
+            continue
+        settled.add(u)
+        # if the extracted node is the end node, i can stop the Dijkstra algorithm
+        if u == target:
+            break
+        for e in graph.get_edges(u):
+            alt_route = dist + e.cost
+            if alt_route < distances.get(e.n_to, float('inf')):
+                parents[e.n_to] = e
+                distances[e.n_to] = alt_route
+                heapq.heappush(heap, (alt_route, next(counter), e.n_to))
+    return distances, parents
 
 
+def _check_dijkstra_input(graph: Graph, start_node: object) -> None:
+    """
+    Checks that Dijkstra algorithm can be run on the given graph from the given node.
+    :raises AttributeError: if the graph is not weighted or it's undirected.
+    :raises KeyError: if the graph not contains start_node.
+    """
+    if not graph.is_directed or not graph.is_weighted:
+        raise AttributeError('The graph must be directed and weighted')
+    if start_node not in graph:
+        raise KeyError(f"The node {start_node=} is not in the graph")
+
+
+@instrumented
 def shortest_path(graph: Graph, start_node: object, end_node: object) -> Tuple[list, float]:
     """
     This method uses Dijkstra algorithm to find the shortest path from a start node to an end node.
@@ -32,45 +121,166 @@ def shortest_path(graph: Graph, start_node: object, end_node: object) -> Tuple[l
     :return: a tuple representing:
     (the edges of the shortest path from start_node to end_node, the overall distance between start_node and end_node).
     If the end_node is not reachable from the start_node, the result will be: ([], inf)
-    :raises AttributeError: if the graph is not weighted or it's directed.
+    :raises AttributeError: if the graph is not weighted or it's undirected.
     :raises KeyError: if the graph not contains start_node.
     """
-    if not graph.is_directed or not graph.is_weighted:
-        raise AttributeError('The graph must be directed and weighted')
-    if start_node not in graph:
-        raise KeyError(f"The node {start_node=} is not in the graph")
+    _check_dijkstra_input(graph, start_node)
+    distances, parents = _dijkstra(graph, start_node, end_node)
+    if end_node not in distances:
+        return [], float('inf')
+    return _build_path(parents, start_node, end_node), distances[end_node]
 
-    parents = {v: None for v in graph.vertices}
-    distances = {v: float('inf') for v in graph.vertices}
-    distances[start_node] = 0
 
-    vertices = graph.vertices.copy()
-    # Dijkstra algorithm
-    while vertices:
-        u = min(vertices, key=lambda v: distances[v])
-        # if the extracted node ha infinite distance, it means that none is incident to that node, so terminate
-        if distances[u] == float('inf'):
+@instrumented
+def shortest_path_tree(graph: Graph, source: object) -> Tuple[dict, dict]:
+    """
+    This method uses Dijkstra algorithm to find the shortest paths from a source node to every other node in one pass.
+    :param graph: the graph to inspect
+    :param source: the node from where the algorithm must starts
+    :return: a tuple representing:
+    (the distance of every node from source, the edge used to reach every node on its shortest path).
+    Unreachable nodes have an infinite distance and a None parent, as the source node.
+    :raises AttributeError: if the graph is not weighted or it's undirected.
+    :raises KeyError: if the graph not contains source.
+    """
+    _check_dijkstra_input(graph, source)
+    reached, reached_parents = _dijkstra(graph, source)
+    distances = {v: reached.get(v, float('inf')) for v in graph.vertices}
+    parents = {v: reached_parents.get(v) for v in graph.vertices}
+    return distances, parents
+
+
+@instrumented
+def bidirectional_shortest_path(graph: Graph, start_node: object, end_node: object) -> Tuple[list, float]:
+    """
+    This method finds the shortest path from a start node to an end node running two Dijkstra searches at once,
+    one forward from start_node on the outgoing edges and one backward from end_node on the incoming edges.
+    It stops when the two searches can't find a shorter path, so it settles far less nodes than shortest_path.
+    :param graph: the graph to inspect
+    :param start_node: the node from where the algorithm must starts
+    :param end_node: the end node of the algorithm
+    :return: a tuple representing:
+    (the edges of the shortest path from start_node to end_node, the overall distance between start_node and end_node).
+    If the end_node is not reachable from the start_node, or it's not in the graph, the result will be: ([], inf)
+    :raises AttributeError: if the graph is not weighted or it's undirected.
+    :raises KeyError: if the graph not contains start_node.
+    """
+    _check_dijkstra_input(graph, start_node)
+    # as in shortest_path, a missing end node is just unreachable
+    if end_node not in graph:
+        return [], float('inf')
+    if start_node == end_node:
+        return [], 0
+
+    # the index 0 is the forward search, the index 1 the backward one
+    distances = ({start_node: 0}, {end_node: 0})
+    parents = ({start_node: None}, {end_node: None})
+    settled = (set(), set())
+    counter = itertools.count()
+    heaps = ([(0, next(counter), start_node)], [(0, next(counter), end_node)])
+    best, meeting_node = float('inf'), None
+    while heaps[0] and heaps[1]:
+        # no path through the unsettled nodes can be shorter than the best one found
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
             break
-        # if the extracted node is the end node, i can stop the Dijkstra algorithm
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        dist, _, u = heapq.heappop(heaps[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+        for e in (graph.get_edges(u) if side == 0 else graph.incoming_edges(u)):
+            v = e.n_to if side == 0 else e.n_from
+            alt_route = dist + e.cost
+            if alt_route < distances[side].get(v, float('inf')):
+                parents[side][v] = e
+                distances[side][v] = alt_route
+                heapq.heappush(heaps[side], (alt_route, next(counter), v))
+            # check if the searches met on a shorter path
+            if v in distances[1 - side] and distances[side][v] + distances[1 - side][v] < best:
+                best, meeting_node = distances[side][v] + distances[1 - side][v], v
+
+    if meeting_node is None:
+        return [], float('inf')
+    path = _build_path(parents[0], start_node, meeting_node)
+    tmp_node = meeting_node
+    while tmp_node != end_node:
+        path.append(parents[1][tmp_node])
+        tmp_node = parents[1][tmp_node].n_to
+    return path, best
+
+
+@instrumented
+def astar_path(graph: Graph, start_node: object, end_node: object,
+               heuristic: Optional[Callable[[object, object], float]] = None) -> Tuple[list, float]:
+    """
+    This method uses A* algorithm to find the shortest path from a start node to an end node.
+    The search is guided towards end_node by a heuristic that estimates the distance between two nodes.
+    The heuristic must never overestimate the distance, otherwise the path might not be the shortest one.
+    :param graph: the graph to inspect
+    :param start_node: the node from where the algorithm must starts
+    :param end_node: the end node of the algorithm
+    :param heuristic: a function (node, end_node) -> estimated distance, e.g. euclidean_heuristic().
+    Without heuristic the algorithm is the same of Dijkstra.
+    :return: a tuple representing:
+    (the edges of the shortest path from start_node to end_node, the overall distance between start_node and end_node).
+    If the end_node is not reachable from the start_node, the result will be: ([], inf)
+    :raises AttributeError: if the graph is not weighted or it's undirected.
+    :raises KeyError: if the graph not contains start_node.
+    """
+    _check_dijkstra_input(graph, start_node)
+    if heuristic is None:
+        heuristic = lambda node, target: 0
+    distances = {start_node: 0}
+    parents = {start_node: None}
+    counter = itertools.count()
+    heap = [(heuristic(start_node, end_node), next(counter), 0, start_node)]
+    while heap:
+        _, _, dist, u = heapq.heappop(heap)
+        # skip the stale entries, a node can be extended again only if a shorter route to it was found
+        if dist > distances[u]:
+            continue
         if u == end_node:
-            break
+            return _build_path(parents, start_node, end_node), dist
         for e in graph.get_edges(u):
-            alt_route = distances[e.n_from] + e.cost
-            if alt_route < distances[e.n_to]:
+            alt_route = dist + e.cost
+            if alt_route < distances.get(e.n_to, float('inf')):
                 parents[e.n_to] = e
                 distances[e.n_to] = alt_route
-        vertices.remove(u)
+                heapq.heappush(heap, (alt_route + heuristic(e.n_to, end_node), next(counter), alt_route, e.n_to))
+    return [], float('inf')
 
-    if distances[end_node] == float('inf'):
-        return [], float('inf')
+
+def euclidean_heuristic(*attributes: str) -> Callable[[object, object], float]:
+    """
+    Builds a heuristic for astar_path that is the euclidean distance between the coordinates of the nodes.
+    :param attributes: the names of the attributes of the nodes that hold their coordinates, by default 'x' and 'y'
+    :return: the heuristic
+    """
+    attributes = attributes or ('x', 'y')
+
+    def heuristic(node: object, target: object) -> float:
+        return math.dist([getattr(node, a) for a in attributes], [getattr(target, a) for a in attributes])
+    return heuristic
+
+
+def _build_path(parents: dict, start_node: object, end_node: object) -> list:
+    """
+    Rebuilds the path from start_node to end_node following the parent edges backward.
+    :param parents: the parent edges computed by Dijkstra algorithm
+    :param start_node: the first node of the path
+    :param end_node: the last node of the path
+    :return: the edges of the path
+    """
     path = []
     tmp_node = end_node
     while tmp_node != start_node:
-        path.insert(0, parents[tmp_node])
+        path.append(parents[tmp_node])
         tmp_node = parents[tmp_node].n_from
-    return path, distances[end_node]
+    path.reverse()
+    return path
 
 
+@instrumented
 def is_dag(graph: Graph) -> bool:
     """
     Function that checks if the given directed graph is a DAG (Directed Acyclic Graph)
@@ -78,34 +288,122 @@ def is_dag(graph: Graph) -> bool:
     :return: True if the graph is a DAG (or if is empty), False otherwise
     :raise Attribute Error: if the graph is undirected.
     """
+    order, n_incoming = _kahn(graph)
+    return len(order) == len(n_incoming)
+
+
+@instrumented
+def topological_sort(graph: Graph) -> Tuple[list, list]:
+    """
+    Function that sorts the nodes of the given directed graph so that every edge goes from a node to a following one.
+    :param graph: the input graph
+    :return: a tuple representing:
+    (the nodes in topological order, []) if the graph is a DAG, ([], the edges of a cycle of the graph) otherwise.
+    :raise Attribute Error: if the graph is undirected.
+    """
+    order, n_incoming = _kahn(graph)
+    if len(order) == len(n_incoming):
+        return order, []
+    return [], _find_cycle(graph, {v for v in n_incoming if n_incoming[v] > 0})
+
+
+def _kahn(graph: Graph) -> Tuple[list, dict]:
+    """
+    Kahn algorithm, it removes the nodes without incoming edges until there are not any.
+    :param graph: the input graph
+    :return: a tuple representing:
+    (the removed nodes in order, the number of incoming edges left for every node of the graph)
+    :raise Attribute Error: if the graph is undirected.
+    """
     if not graph.is_directed:
         raise AttributeError('The graph must be directed')
-    n_incoming = {v: len(graph.incoming_edges(v)) for v in graph.vertices}
-    s = [v for v in graph.vertices if n_incoming[v] == 0]
+    # count the incoming edges with a single sweep of the outgoing ones
+    n_incoming = {v: 0 for v in graph.vertices}
+    for v in n_incoming:
+        for _, u, *_ in graph.get_edges(v):
+            n_incoming[u] += 1
+    s = collections.deque(v for v in n_incoming if n_incoming[v] == 0)
+    order = []
     while s:
-        v = s[0]
+        v = s.popleft()
+        order.append(v)
         for _, u, *_ in graph.get_edges(v):
             n_incoming[u] -= 1
             if n_incoming[u] == 0:
                 s.append(u)
-        del s[0]
-    return all(x == 0 for x in n_incoming.values()) or not bool(n_incoming.values())
+    return order, n_incoming
 
 
+def _find_cycle(graph: Graph, remaining: set) -> list:
+    """
+    Finds a cycle among the nodes left by Kahn algorithm.
+    Each of them has an incoming edge from another one, so going backward from any of them always closes a cycle.
+    :param graph: the input graph
+    :param remaining: the nodes left by Kahn algorithm
+    :return: the edges of the cycle, in order
+    """
+    parents = {}
+    for v in remaining:
+        for e in graph.get_edges(v):
+            parents[e.n_to] = e
+    # go backward until a node repeats
+    visited = set()
+    v = next(iter(remaining))
+    while v not in visited:
+        visited.add(v)
+        v = parents[v].n_from
+    cycle = [parents[v]]
+    while cycle[-1].n_from != v:
+        cycle.append(parents[cycle[-1].n_from])
+    cycle.reverse()
+    return cycle
+
+
+@instrumented
 def approx_vertex_cover(graph: Graph) -> set:
     """
-    Function that finds the maximum vertex-cover of the given undirected graph.
+    Function that finds a vertex-cover of the given undirected graph, at most twice as big as the minimum one.
+    The cover is made by the ends of a maximal matching, built with a single pass over the edges.
     :param graph: the input graph
-    :return: the maximum vertex-cover of the graph
+    :return: the approximated minimum vertex-cover of the graph
     :raise AttributeError: if the input graph is a directed graph
     """
     if graph.is_directed:
         raise AttributeError('The graph must be undirected')
     vc = set()
-    edges = list(graph.edges)
-    while edges:
-        n_from, n_to = edges[0]
-        vc.add(n_from)
-        vc.add(n_to)
-        edges = [e for e in edges if e.n_from != n_from and e.n_from != n_to and e.n_to != n_from and e.n_to != n_to]
+    for v in graph.vertices:
+        if v in vc:
+            continue
+        # match the node with its first uncovered neighbor, if any
+        for e in graph.get_edges(v):
+            if e.n_to not in vc:
+                vc.add(v)
+                vc.add(e.n_to)
+                break
     return vc
+
+
+@instrumented
+def approx_weighted_vertex_cover(graph: Graph, weight: str = 'weight') -> set:
+    """
+    Function that finds a vertex-cover of the given undirected graph, whose weight is at most twice the minimum one.
+    It uses the local-ratio algorithm: every edge with both ends not yet paid lowers the residual weight of its ends
+    by the lowest of the two, and the cover is made by the nodes whose residual weight drops to zero.
+    :param graph: the input graph
+    :param weight: the name of the attribute of the nodes that holds their weight, a missing attribute weights 1
+    :return: the approximated minimum weight vertex-cover of the graph
+    :raise AttributeError: if the input graph is a directed graph
+    """
+    if graph.is_directed:
+        raise AttributeError('The graph must be undirected')
+    residual = {}
+    for u in graph.vertices:
+        for e in graph.get_edges(u):
+            v = e.n_to
+            ru = residual.setdefault(u, getattr(u, weight, 1))
+            rv = residual.setdefault(v, getattr(v, weight, 1))
+            if ru > 0 and rv > 0:
+                delta = min(ru, rv)
+                residual[u] = ru - delta
+                residual[v] = rv - delta if v != u else 0
+    return {v for v in residual if residual[v] <= 0}
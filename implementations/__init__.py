@@ -1,8 +1,33 @@
 """
-This package contains the different implementations of the graph
+This package contains the different implementations of the graph.
+The implementations based on NumPy are imported the first time they are used, so importing the package doesn't load NumPy.
 """
+import importlib
 
-from adt.graph.implementations.adjacency_matrix import AdjacencyMatrixGraph
 from adt.graph.implementations.adjacency_list import AdjacencyListGraph
 
+# the lazily imported implementations, with the modules that define them
+_LAZY_ATTRIBUTES = {
+    'AdjacencyMatrixGraph': 'adt.graph.implementations.adjacency_matrix',
+    'CSRGraph': 'adt.graph.implementations.csr',
+}
+
+__all__ = ['AdjacencyListGraph', *_LAZY_ATTRIBUTES]
+
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> object:
+    """
+    Imports a lazy attribute the first time it is read (PEP 562)
+    """
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    # store the attribute, so the next reads don't call this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -1,6 +1,6 @@
 import adt.graph.util.exceptions as exc
-from adt.graph.core import Graph, Node, Edge, WeightedEdge
-from typing import Set, Union
+from adt.graph.core import Graph, ImmutableGraph, Node, Edge, WeightedEdge
+from typing import FrozenSet, Iterable, Set, Union
 
 
 class AdjacencyListGraph(Graph):
@@ -9,43 +9,74 @@ class AdjacencyListGraph(Graph):
     """
     def __init__(self, *, directed: bool = False, weighted: bool = False):
         super().__init__(directed=directed, weighted=weighted)
+        # for each node, the costs of the edges that ends with it indexed by their start node (used only by directed graphs)
         self._rev_adjacent_list = {}
+        # for each node, the costs of the edges that starts with it indexed by their end node.
+        # In undirected graphs each edge is stored in both directions. The cost of an unweighted edge is None.
+        # The Edge tuples are built only when requested, so storing an edge costs just a dict entry.
         self._adjacent_list = {}
+        # the number of edges, an undirected edge is counted once
+        self._n_edges = 0
+        # the nodes whose edge dicts are not shared with a snapshot, None if no snapshot was taken.
+        # A shared dict is copied before it is changed, so the snapshots never see the changes.
+        self._owned = None
+        self._rev_owned = None
 
     @property
-    def vertices(self) -> Set[object]:
-        return set(self._adjacent_list.keys())
+    def vertices(self) -> FrozenSet[object]:
+        if self._vertices_view is None:
+            self._vertices_view = frozenset(self._adjacent_list)
+        return self._vertices_view
 
     @property
-    def edges(self) -> Set[Union[Edge, WeightedEdge]]:
-        return set.union(*self._adjacent_list.values())
+    def edges(self) -> FrozenSet[Union[Edge, WeightedEdge]]:
+        if self._edges_view is None:
+            if self.is_weighted:
+                self._edges_view = frozenset(WeightedEdge(node_from, node_to, cost)
+                                             for node_from, edges in self._adjacent_list.items()
+                                             for node_to, cost in edges.items())
+            else:
+                self._edges_view = frozenset(Edge(node_from, node_to)
+                                             for node_from, edges in self._adjacent_list.items() for node_to in edges)
+        return self._edges_view
+
+    @property
+    def num_edges(self) -> int:
+        return self._n_edges
+
+    def __len__(self) -> int:
+        return len(self._adjacent_list)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._adjacent_list
 
     def get_edges(self, node: Node) -> Set[Union[Edge, WeightedEdge]]:
-        # if the graph is directed, return the values from the adjacent list
-        if self.is_directed:
-            return self._adjacent_list[node]
-        # if not return all
-        else:
-            rev_edges = set()
-            # get all the reverse edges of the edge
-            for n in self._rev_adjacent_list[node]:
-                for e in self._adjacent_list[n]:
-                    if e.node2 is node:
-                        rev_edges.add(WeightedEdge(e.node2, e.node1, e.cost) if self.is_weighted else Edge(e.node2, e.node1))
-            return set.union(rev_edges, self._adjacent_list[node])
+        if self.is_weighted:
+            return {WeightedEdge(node, node_to, cost) for node_to, cost in self._adjacent_list[node].items()}
+        return {Edge(node, node_to) for node_to in self._adjacent_list[node]}
 
     def incoming_edges(self, node: Node) -> Set[Union[Edge, WeightedEdge]]:
-        if node not in self.vertices:
+        if node not in self._adjacent_list:
             raise exc.NotInGraph()
         if self.is_directed:
-            return {e for v in self._rev_adjacent_list[node] for e in self._adjacent_list[v] if e.node2 is node}
+            if self.is_weighted:
+                return {WeightedEdge(node_from, node, cost) for node_from, cost in self._rev_adjacent_list[node].items()}
+            return {Edge(node_from, node) for node_from in self._rev_adjacent_list[node]}
         else:
             return self.get_edges(node)
 
     def add_vertex(self, node: Node, *nodes: Node) -> None:
         for node in (node,) + nodes:
-            self._adjacent_list.setdefault(node, set())
-            self._rev_adjacent_list.setdefault(node, set())
+            if node in self._adjacent_list:
+                continue
+            self._adjacent_list[node] = {}
+            if self.is_directed:
+                self._rev_adjacent_list[node] = {}
+            if self._owned is not None:
+                self._owned.add(node)
+                self._rev_owned.add(node)
+            self._index_vertex(node)
+            self._changed()
 
     def add_edge(self, node_from: Node, node_to: Node, *nodes_to: Node, cost: object = 0, reverse: bool = False) -> None:
         for node in (nodes_to := (node_to,) + nodes_to) + (node_from,):
@@ -53,43 +84,188 @@ class AdjacencyListGraph(Graph):
                 raise exc.NotInGraph()
 
         for dst_node in nodes_to:
-            edges = self._adjacent_list.get(node_from)
-            new_edge = WeightedEdge(node_from, dst_node, cost) if self.is_weighted else Edge(node_from, dst_node)
-            if self.is_directed or dst_node not in self._rev_adjacent_list[node_from]:
-                edges.add(new_edge)
-                self._rev_adjacent_list[dst_node].add(node_from)
+            if self.__store_edge(node_from, dst_node, cost):
+                self._n_edges += 1
+            self._index_edge(node_from, dst_node)
+        self._changed()
 
         if self.is_directed and reverse:
             for node in nodes_to:
                 self.add_edge(node, node_from, cost=cost, reverse=False)
 
+    def __store_edge(self, node_from: Node, node_to: Node, cost: object) -> bool:
+        """
+        Stores the edge from node_from to node_to, replacing the previous one if exists, without checking the nodes.
+        A directed edge is stored also in the reverse adjacent list, an undirected one also from node_to.
+        :param node_from: the start node of the edge
+        :param node_to: the end node of the edge
+        :param cost: the cost of the edge, used only if the graph is weighted
+        :return: True if the edge is new, False if it replaced another one
+        """
+        cost = cost if self.is_weighted else None
+        if self.is_directed:
+            reverse_list, reverse_owned = self._rev_adjacent_list, self._rev_owned
+        else:
+            reverse_list, reverse_owned = self._adjacent_list, self._owned
+        if self._owned is None:
+            edges, reverse_edges = self._adjacent_list[node_from], reverse_list[node_to]
+        else:
+            # copy the dicts shared with a snapshot before changing them
+            edges = self.__own(self._adjacent_list, self._owned, node_from)
+            reverse_edges = self.__own(reverse_list, reverse_owned, node_to)
+        is_new = node_to not in edges
+        edges[node_to] = cost
+        reverse_edges[node_from] = cost
+        return is_new
+
+    @staticmethod
+    def __own(adjacent_list: dict, owned: set, node: Node) -> dict:
+        """
+        Gets the edge dict of a node in order to change it, copying it first if it is shared with a snapshot.
+        :param adjacent_list: the adjacent list that contains the dict
+        :param owned: the nodes whose dicts are not shared, None if no snapshot was taken
+        :param node: the node of the dict
+        :return: the dict that can be changed
+        """
+        edges = adjacent_list[node]
+        if owned is not None and node not in owned:
+            edges = adjacent_list[node] = dict(edges)
+            owned.add(node)
+        return edges
+
+    def add_edges_from(self, edges: Iterable[tuple]) -> None:
+        adjacent_list, store_edge = self._adjacent_list, self.__store_edge
+        components = self._components if not self._components_stale else None
+        for node_from, node_to, *rest in edges:
+            # add the missing nodes without checking the others
+            if node_from not in adjacent_list:
+                self.add_vertex(node_from)
+            if node_to not in adjacent_list:
+                self.add_vertex(node_to)
+            if store_edge(node_from, node_to, rest[0] if rest else 0):
+                self._n_edges += 1
+            if components is not None:
+                components.union(node_from, node_to)
+        self._changed()
+
     def remove_vertex(self, node: Node) -> None:
-        for node_from in self._rev_adjacent_list[node]:
-            self._adjacent_list[node_from] = {edge for edge in self._adjacent_list[node_from] if edge.node2 != node}
-        for node_from in (n for n in self._rev_adjacent_list if n != node):
-            self._rev_adjacent_list[node_from].remove(node)
-        del self._adjacent_list[node]
-        del self._rev_adjacent_list[node]
+        if node not in self._adjacent_list:
+            return
+        # remove the edges that starts from the node looking only at its neighbors
+        edges = self._adjacent_list.pop(node)
+        self._n_edges -= len(edges)
+        for node_to in edges:
+            if self.is_directed:
+                del self.__own(self._rev_adjacent_list, self._rev_owned, node_to)[node]
+            elif node_to != node:
+                del self.__own(self._adjacent_list, self._owned, node_to)[node]
+        # remove the edges that ends with the node, the self loop is already removed
+        if self.is_directed:
+            rev_edges = self._rev_adjacent_list.pop(node)
+            self._n_edges -= len(rev_edges)
+            for node_from in rev_edges:
+                del self.__own(self._adjacent_list, self._owned, node_from)[node]
+        if self._owned is not None:
+            self._owned.discard(node)
+            self._rev_owned.discard(node)
+        self._index_removal()
+        self._changed()
+
+    def remove_vertices_from(self, nodes: Iterable[Node]) -> None:
+        adjacent_list, rev_adjacent_list = self._adjacent_list, self._rev_adjacent_list
+        owned, rev_owned, own = self._owned, self._rev_owned, self.__own
+        removed = {node for node in nodes if node in adjacent_list}
+        if not removed:
+            return
+        # the edges between two removed nodes are dropped with their dicts, only the other neighbors are updated
+        n_removed, n_inner = 0, 0
+        for node in removed:
+            edges = adjacent_list.pop(node)
+            if self.is_directed:
+                n_removed += len(edges)
+                for node_to in edges:
+                    if node_to not in removed:
+                        del own(rev_adjacent_list, rev_owned, node_to)[node]
+                continue
+            for node_to in edges:
+                if node_to not in removed:
+                    del own(adjacent_list, owned, node_to)[node]
+                    n_removed += 1
+                elif node_to == node:
+                    n_removed += 1
+                else:
+                    # this undirected edge is found from both its ends
+                    n_inner += 1
+        if self.is_directed:
+            # the edges that ends with a removed node and starts with a remaining one
+            for node in removed:
+                for node_from in rev_adjacent_list.pop(node):
+                    if node_from not in removed:
+                        del own(adjacent_list, owned, node_from)[node]
+                        n_removed += 1
+        self._n_edges -= n_removed + n_inner // 2
+        if owned is not None:
+            owned -= removed
+            rev_owned -= removed
+        self._index_removal()
+        self._changed()
+
+    def induced_subgraph(self, nodes: Iterable[Node]) -> 'AdjacencyListGraph':
+        nodes = [node for node in dict.fromkeys(nodes) if node in self._adjacent_list]
+        keep = set(nodes)
+        graph = self._empty_like()
+        # copy the edge dicts of the kept nodes, without their edges to the other nodes
+        graph._adjacent_list = {node: {node_to: cost for node_to, cost in self._adjacent_list[node].items() if node_to in keep}
+                                for node in nodes}
+        n_edges = sum(len(edges) for edges in graph._adjacent_list.values())
+        if self.is_directed:
+            graph._rev_adjacent_list = {node: {node_from: cost for node_from, cost in self._rev_adjacent_list[node].items()
+                                               if node_from in keep} for node in nodes}
+        else:
+            # an undirected edge is stored in both its ends, except for the self loops
+            n_edges = (n_edges + sum(1 for node in nodes if node in graph._adjacent_list[node])) // 2
+        graph._n_edges = n_edges
+        return graph
+
+    def _empty_like(self) -> 'AdjacencyListGraph':
+        return AdjacencyListGraph(directed=self.is_directed, weighted=self.is_weighted)
 
     def remove_edge(self, edge: tuple) -> bool:
         node_from, node_to = edge
-        if not self.is_directed and self._rev_adjacent_list[node_from] is not None:
-            self._adjacent_list[node_to] = {e for e in self._adjacent_list[node_to] if e.node2 != node_from}
-            self._adjacent_list[node_from] = {e for e in self._adjacent_list[node_from] if e.node2 != node_to}
-            rem1, rem2 = True, True
-            try:
-                self._rev_adjacent_list[node_from].remove(node_to)
-            except KeyError:
-                rem1 = False
-            try:
-                self._rev_adjacent_list[node_to].remove(node_from)
-            except KeyError:
-                rem2 = False
-            return rem1 or rem2
+        if node_to not in self._adjacent_list:
+            raise KeyError(node_to)
+        if node_to not in self._adjacent_list[node_from]:
+            return False
+        del self.__own(self._adjacent_list, self._owned, node_from)[node_to]
+        if self.is_directed:
+            del self.__own(self._rev_adjacent_list, self._rev_owned, node_to)[node_from]
         else:
-            try:
-                self._adjacent_list[node_from] = {e for e in self._adjacent_list[node_from] if e.node2 != node_to}
-                self._rev_adjacent_list[node_to].remove(node_from)
-                return True
-            except KeyError:
-                return False
+            self.__own(self._adjacent_list, self._owned, node_to).pop(node_from, None)
+        self._n_edges -= 1
+        self._index_removal()
+        self._changed()
+        return True
+
+    def snapshot(self) -> 'AdjacencyListSnapshot':
+        """
+        Builds a read-only view of the current state of the graph, that many threads can read without locks
+        while the graph keeps changing. It must be called by the thread that changes the graph.
+        The view copies only the dicts of the nodes, O(V), and shares the edge dicts with the graph:
+        the graph copies an edge dict the first time it changes it after the snapshot.
+        :return: the read-only view of the graph
+        """
+        snapshot = AdjacencyListSnapshot.__new__(AdjacencyListSnapshot)
+        vars(snapshot).update(vars(self))
+        snapshot._adjacent_list = dict(self._adjacent_list)
+        snapshot._rev_adjacent_list = dict(self._rev_adjacent_list)
+        snapshot._owned = snapshot._rev_owned = None
+        snapshot._components = self._components.copy() if self._components is not None else None
+        # all the edge dicts are now shared with the snapshot
+        self._owned, self._rev_owned = set(), set()
+        return snapshot
+
+
+class AdjacencyListSnapshot(ImmutableGraph, AdjacencyListGraph):
+    """
+    Read-only view of an AdjacencyListGraph, built by AdjacencyListGraph.snapshot.
+    """
@@ -1,20 +1,43 @@
 import numpy as np
 import adt.graph.util.exceptions as exc
-from typing import Set, Union
+from typing import FrozenSet, Iterable, Optional, Set, Union
+from adt.graph.util import sparse
 from adt.graph.util.bidict import Bidict
-from adt.graph.core import Graph, Node, Edge, WeightedEdge
+from adt.graph.core import Graph, ImmutableGraph, Node, Edge, WeightedEdge
 
 
 class AdjacencyMatrixGraph(Graph):
 	"""
 	Graph implementation with Adjacent Matrix
 	"""
-	def __init__(self, *, directed: bool = False, weighted: bool = False):
+	def __init__(self, *, directed: bool = False, weighted: bool = False, dtype: object = object):
+		"""
+		Instance initializer
+		:param directed: true if is a directed graph, false otherwise
+		:param weighted: true if is a weighted graph, false otherwise
+		:param dtype: the type of the values of the adjacent matrix.
+		With the default object type a missing edge is None, so the costs can't be None.
+		With a numeric type (e.g. np.float64) the costs must be numbers of that type. A missing edge is NaN for the
+		floating types, so the costs can't be NaN, and 0 in an unweighted graph, so np.bool_ takes a byte per cell.
+		Only a weighted graph of integers needs a boolean mask of the same size of the matrix to mark the edges,
+		since any integer can be a cost.
+		"""
 		super().__init__(directed=directed, weighted=weighted)
 		# this variable contains the node indexes
 		self._nodes_indexes = Bidict()
-		# this variable represents the adjacent matrix
-		self._matrix = np.array([], dtype=object)
+		# this variable is the value of the adjacent matrix when there is no edge
+		self._dtype = np.dtype(dtype)
+		self._no_edge = None if self._dtype == object else np.nan if self._dtype.kind in 'fc' else 0
+		# this variable represents the adjacent matrix, preallocated with a capacity greater or equal to the number of nodes
+		self._matrix = np.full((0, 0), self._no_edge, dtype=self._dtype)
+		# this variable marks the cells of the adjacent matrix that contain an edge, None if the values tell it by themselves
+		self._mask = np.zeros((0, 0), dtype=bool) if weighted and self._dtype.kind in 'biu' else None
+		# this variable is the logical size of the adjacent matrix, that is the number of nodes
+		self._size = 0
+		# this variable is the number of edges, an undirected edge is counted once
+		self._n_edges = 0
+		# this variable is True if the adjacent matrix and the node indexes are shared with the last snapshot
+		self._shared = False
 
 	@property
 	def matrix(self) -> np.ndarray:
@@ -22,29 +45,68 @@ class AdjacencyMatrixGraph(Graph):
 		Property
 		:return: a copy of the adjacency matrix of the graph
 		"""
-		return self._matrix.copy()
+		return self._matrix[:self._size, :self._size].copy()
+
+	@property
+	def mask(self) -> np.ndarray:
+		"""
+		Property
+		:return: a copy of the boolean matrix that is True where the adjacency matrix contains an edge
+		"""
+		return np.array(self.__has_edges(np.s_[:self._size, :self._size]), dtype=bool)
+
+	@property
+	def dtype(self) -> np.dtype:
+		"""
+		Property
+		:return: the type of the values of the adjacency matrix
+		"""
+		return self._dtype
 
 	@property
-	def vertices(self) -> Set[Node]:
-		return set(self._nodes_indexes.keys())
+	def nodes(self) -> list:
+		"""
+		Property
+		:return: the nodes in the order of the rows and the columns of the adjacency matrix
+		"""
+		return [self._nodes_indexes.inverse[i][0] for i in range(self._size)]
 
 	@property
-	def edges(self) -> Set[Union[Edge, WeightedEdge]]:
-		sets = set.union(*(self.get_edges(node) for node in self._nodes_indexes))
-		return sets
+	def vertices(self) -> FrozenSet[Node]:
+		if self._vertices_view is None:
+			self._vertices_view = frozenset(self._nodes_indexes)
+		return self._vertices_view
+
+	@property
+	def edges(self) -> FrozenSet[Union[Edge, WeightedEdge]]:
+		if self._edges_view is None:
+			self._edges_view = frozenset().union(*(self.get_edges(node) for node in self._nodes_indexes))
+		return self._edges_view
+
+	@property
+	def num_edges(self) -> int:
+		return self._n_edges
+
+	def __len__(self) -> int:
+		return self._size
+
+	def __contains__(self, node: object) -> bool:
+		return node in self._nodes_indexes
 
 	def get_edges(self, node: Node) -> Set[Union[Edge, WeightedEdge]]:
 		# check if the node is in the graph
 		if self._nodes_indexes.get(node) is None:
 			raise exc.NotInGraph()
 
-		# get the row of the edges that starts with input node
-		row = self._matrix[self._nodes_indexes[node]]
+		# get the indexes of the edges that starts with input node
+		idx = self._nodes_indexes[node]
+		cols = np.flatnonzero(self.__has_edges(np.s_[idx, :self._size]))
 		# get all the edges incidents to the node
 		if self.is_weighted:
-			fs = {WeightedEdge(node, self._nodes_indexes.inverse[i][0], row[i]) for i in range(len(row)) if row[i] is not None}
+			costs = self._matrix[idx, cols].tolist()
+			fs = {WeightedEdge(node, self._nodes_indexes.inverse[i][0], c) for i, c in zip(cols.tolist(), costs)}
 		else:
-			fs = {Edge(node, self._nodes_indexes.inverse[i][0]) for i in range(len(row)) if row[i] is not None}
+			fs = {Edge(node, self._nodes_indexes.inverse[i][0]) for i in cols.tolist()}
 
 		return fs
 
@@ -57,16 +119,44 @@ class AdjacencyMatrixGraph(Graph):
 		if self._nodes_indexes.get(node) is None:
 			raise exc.NotInGraph()
 
-		# get the row of the edges that starts with input node
-		col = self._matrix[:, self._nodes_indexes[node]]
+		# get the indexes of the edges that ends with input node
+		idx = self._nodes_indexes[node]
+		rows = np.flatnonzero(self.__has_edges(np.s_[:self._size, idx]))
 		# get all the edges incidents to the node
 		if self.is_weighted:
-			bs = {WeightedEdge(self._nodes_indexes.inverse[i][0], node, col[i]) for i in range(len(col)) if col[i] is not None}
+			costs = self._matrix[rows, idx].tolist()
+			bs = {WeightedEdge(self._nodes_indexes.inverse[i][0], node, c) for i, c in zip(rows.tolist(), costs)}
 		else:
-			bs = {Edge(self._nodes_indexes.inverse[i][0], node) for i in range(len(col)) if col[i] is not None}
+			bs = {Edge(self._nodes_indexes.inverse[i][0], node) for i in rows.tolist()}
 
 		return bs
 
+	def __has_edges(self, key: tuple) -> np.ndarray:
+		"""
+		Finds the edges in a part of the adjacent matrix
+		:param key: the index of the part of the matrix
+		:return: a boolean array that is True where the part contains an edge
+		"""
+		if self._mask is not None:
+			return self._mask[key]
+		values = self._matrix[key]
+		if self._dtype == object:
+			return np.not_equal(values, None)
+		if self._dtype.kind in 'fc':
+			return ~np.isnan(values)
+		return values != 0
+
+	def __unshare(self) -> None:
+		"""
+		Copies the adjacent matrix and the node indexes shared with the last snapshot, so the graph can change them
+		"""
+		if self._shared:
+			self._matrix = self._matrix.copy()
+			if self._mask is not None:
+				self._mask = self._mask.copy()
+			self._nodes_indexes = Bidict(self._nodes_indexes)
+			self._shared = False
+
 	def __new_node_idx(self, node: Node) -> int:
 		"""
 		Inspect the graph to get the index of a new node
@@ -75,34 +165,52 @@ class AdjacencyMatrixGraph(Graph):
 		"""
 		return len(self._nodes_indexes)
 
+	def __ensure_capacity(self, size: int) -> None:
+		"""
+		Grows the adjacent matrix until it can contain the given number of nodes.
+		The capacity is doubled, unless more nodes are added at once: then it is exactly the needed one.
+		:param size: the number of nodes to fit
+		"""
+		capacity = len(self._matrix)
+		if size <= capacity:
+			return
+		self.__resize(max(size, 2 * capacity))
+
+	def __resize(self, capacity: int) -> None:
+		"""
+		Moves the adjacent matrix in a new one of the given capacity, that must be greater or equal to the number of nodes
+		:param capacity: the new capacity
+		"""
+		matrix = np.full((capacity, capacity), self._no_edge, dtype=self._dtype)
+		matrix[:self._size, :self._size] = self._matrix[:self._size, :self._size]
+		self._matrix = matrix
+		if self._mask is not None:
+			mask = np.zeros((capacity, capacity), dtype=bool)
+			mask[:self._size, :self._size] = self._mask[:self._size, :self._size]
+			self._mask = mask
+
 	def add_vertex(self, node: Node, *nodes: Node) -> None:
+		self.__unshare()
+		# make room for all the input nodes at once
+		self.__ensure_capacity(self._size + 1 + len(nodes))
+
 		# iter the process for all input nodes
 		for node in (node,) + nodes:
 			# check if the node is already in graph
 			if self._nodes_indexes.get(node) is not None:
 				raise exc.AlreadyInGraph()
 
-			# assign an index to the node to insert
+			# assign an index to the node to insert, its row and column are already empty
 			self._nodes_indexes[node] = self.__new_node_idx(node)
-
-			# get index of the matrix
-			idx = self._nodes_indexes[node]
-
-			# if the size of the array greater than 1, reshape to build the matrix
-			if len(self._nodes_indexes) == 1:
-				self._matrix = np.insert(self._matrix, idx, [None])
-				self._matrix = np.reshape(self._matrix, (1, 1))
-
-			# add a raw and a column only if the matrix is at least a 1x1 size
-			if len(self._nodes_indexes) > 1:
-				# append the node to the adjacent matrix
-				self._matrix = np.insert(self._matrix, idx, [None], axis=0)
-				self._matrix = np.insert(self._matrix, idx, [None], axis=1)
+			self._size += 1
+			self._index_vertex(node)
+			self._changed()
 
 	def add_edge(self, node_from: Node, node_to: Node, *nodes_to: Node, cost: object = 0, reverse: bool = False) -> None:
 		# get the index of the from node and check if the from node is in the graph
 		if (idx_from := self._nodes_indexes.get(node_from)) is None:
 			raise exc.NotInGraph()
+		self.__unshare()
 
 		# iter the process to all destination nodes
 		for node_to in (node_to,) + nodes_to:
@@ -113,33 +221,164 @@ class AdjacencyMatrixGraph(Graph):
 			# get the value of the edge, if is weighted, the value will be the cost of the edge
 			edge_val = cost if self.is_weighted else 1
 
+			# count the edge only if it's new
+			if not self.__has_edges(np.s_[idx_from, idx_to]):
+				self._n_edges += 1
+
 			# insert the edge cost to the adjacent matrix
 			self._matrix[idx_from, idx_to] = edge_val
+			if self._mask is not None:
+				self._mask[idx_from, idx_to] = True
 
 			# i symmetrically insert the same edge if the graph is not directed
 			if not self.is_directed:
 				self._matrix[idx_to, idx_from] = edge_val
+				if self._mask is not None:
+					self._mask[idx_to, idx_from] = True
+				self._index_edge(node_from, node_to)
 
 			# repeat this process if the reverse mode is selected and the graph is directed
 			if reverse and self.is_directed:
 				self.add_edge(node_to, node_from, cost=cost, reverse=False)
 
+		self._changed()
+
+	def add_edges_from(self, edges: Iterable[tuple]) -> None:
+		edges = list(edges)
+		# add all the missing nodes at once, so the matrix grows to exactly the needed capacity
+		missing = dict.fromkeys(node for e in edges for node in e[:2] if self._nodes_indexes.get(node) is None)
+		if missing:
+			self.add_vertex(*missing)
+		rows, cols, values = [], [], []
+		for node_from, node_to, *cost in edges:
+			rows.append(self._nodes_indexes[node_from])
+			cols.append(self._nodes_indexes[node_to])
+			values.append((cost[0] if cost else 0) if self.is_weighted else 1)
+		if not rows:
+			return
+		self.__set_edges(np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp), np.array(values, dtype=self._dtype))
+
+	def __set_edges(self, rows: np.ndarray, cols: np.ndarray, values: np.ndarray) -> None:
+		"""
+		Inserts many edges between nodes of the graph with a single assignment.
+		:param rows: the indexes of the start nodes
+		:param cols: the indexes of the end nodes
+		:param values: the values of the edges in the adjacent matrix
+		"""
+		self.__unshare()
+		# count the new edges, each of them once even if repeated
+		lo, hi = (rows, cols) if self.is_directed else (np.minimum(rows, cols), np.maximum(rows, cols))
+		keys = np.unique(lo * self._size + hi)
+		self._n_edges += int(np.count_nonzero(~self.__has_edges(np.s_[keys // self._size, keys % self._size])))
+
+		# in undirected graphs each edge is followed by its reverse, so the last cost of an edge wins on both sides
+		if not self.is_directed:
+			rows, cols = np.stack((rows, cols), axis=1).ravel(), np.stack((cols, rows), axis=1).ravel()
+			values = np.repeat(values, 2)
+
+		# insert all the edges to the adjacent matrix at once
+		self._matrix[rows, cols] = values
+		if self._mask is not None:
+			self._mask[rows, cols] = True
+		if self._components is not None and not self._components_stale:
+			inverse = self._nodes_indexes.inverse
+			for idx_from, idx_to in zip(rows.tolist(), cols.tolist()):
+				self._components.union(inverse[idx_from][0], inverse[idx_to][0])
+		self._changed()
+
+	def _empty_like(self) -> 'AdjacencyMatrixGraph':
+		return AdjacencyMatrixGraph(directed=self.is_directed, weighted=self.is_weighted, dtype=self._dtype)
+
+	def to_sparse(self, fmt: str = 'csr') -> object:
+		"""
+		Exports the adjacency matrix as a sparse matrix, whose elements are the costs of the edges (1 if not weighted).
+		:param fmt: 'csr' for compressed sparse rows, 'coo' for coordinates
+		:return: a SciPy sparse matrix if SciPy is installed, otherwise a CSRMatrix or a COOMatrix of NumPy arrays
+		with the same attributes of the SciPy ones
+		:raises ValueError: if the format is not supported
+		"""
+		rows, cols = np.nonzero(self.__has_edges(np.s_[:self._size, :self._size]))
+		if self.is_weighted:
+			data = self._matrix[rows, cols]
+			# the costs in an object matrix are converted to numbers if possible
+			if data.dtype == object and len(data):
+				numbers = np.array(data.tolist())
+				data = numbers if numbers.dtype.kind in 'biuf' else data
+		else:
+			data = np.ones(len(rows), dtype=np.int64)
+		return sparse.make_sparse(rows, cols, data, (self._size, self._size), fmt)
+
+	@classmethod
+	def from_sparse(cls, matrix: object, nodes: Optional[Iterable[Node]] = None, *, directed: bool = False,
+					weighted: bool = False, **kwargs) -> 'AdjacencyMatrixGraph':
+		"""
+		Builds a graph from a sparse matrix, where the element [i, j] is the edge from the i-th node to the j-th one.
+		In an undirected graph, if both [i, j] and [j, i] are stored, the last one in row order is kept.
+		:param matrix: a SciPy sparse matrix, a CSRMatrix, a COOMatrix or a dense square NumPy matrix
+		:param nodes: the nodes in the order of the rows, the integers from 0 to n - 1 if None
+		:param directed: true if is a directed graph, false otherwise
+		:param weighted: true if the elements of the matrix are the costs of the edges, false otherwise
+		:param kwargs: the other arguments of the initializer, e.g. dtype
+		:return: the new graph
+		:raises ValueError: if the matrix is not square or the number of nodes is not the size of the matrix
+		:raises TypeError: if the matrix type is not supported
+		"""
+		row, col, data, shape = sparse.to_coo(matrix)
+		if shape[0] != shape[1]:
+			raise ValueError('The matrix must be square')
+		nodes = list(range(shape[0]) if nodes is None else nodes)
+		if len(nodes) != shape[0]:
+			raise ValueError('The number of nodes must be the size of the matrix')
+
+		graph = cls(directed=directed, weighted=weighted, **kwargs)
+		if nodes:
+			graph.add_vertex(*nodes)
+		if len(row):
+			values = np.asarray(data) if weighted else np.ones(len(row), dtype=np.int64)
+			graph.__set_edges(np.asarray(row, dtype=np.intp), np.asarray(col, dtype=np.intp), values.astype(graph._dtype))
+		return graph
+
 	def remove_vertex(self, node: Node) -> None:
 		if self._nodes_indexes.get(node) is None:
 			return
+		self.__unshare()
 
 		# get the value of the index node to remove
 		rem_idx = self._nodes_indexes[node]
 
-		# remove the i-th column and row from the matrix
-		self._matrix = np.delete(self._matrix, rem_idx, axis=0)
-		self._matrix = np.delete(self._matrix, rem_idx, axis=1)
+		last_idx = self._size - 1
+
+		# discount the edges of the node, counting the self loop once
+		n_removed = np.count_nonzero(self.__has_edges(np.s_[rem_idx, :self._size]))
+		if self.is_directed:
+			n_removed += (np.count_nonzero(self.__has_edges(np.s_[:self._size, rem_idx]))
+						- int(self.__has_edges(np.s_[rem_idx, rem_idx])))
+		self._n_edges -= int(n_removed)
 
 		# remove the vertex from the dict of vertex and index
 		del self._nodes_indexes[node]
 
-		# update the remaining indexes
-		self._nodes_indexes = Bidict({self._nodes_indexes.inverse[i][0]: (i if i < rem_idx else i - 1) for i in self._nodes_indexes.inverse})
+		# move the last node in the place of the removed one, so the matrix stays compact without copies
+		if rem_idx != last_idx:
+			last_node = self._nodes_indexes.inverse[last_idx][0]
+			for m in (self._matrix, self._mask) if self._mask is not None else (self._matrix,):
+				m[rem_idx, :self._size] = m[last_idx, :self._size]
+				m[:self._size, rem_idx] = m[:self._size, last_idx]
+			del self._nodes_indexes[last_node]
+			self._nodes_indexes[last_node] = rem_idx
+
+		# clear the last row and column, that are now outside the matrix
+		self._matrix[last_idx, :self._size] = self._no_edge
+		self._matrix[:self._size, last_idx] = self._no_edge
+		if self._mask is not None:
+			self._mask[last_idx, :self._size] = False
+			self._mask[:self._size, last_idx] = False
+		self._size -= 1
+		# release the memory when the nodes are a quarter of the capacity, halving it keeps room for new nodes
+		if self._size <= len(self._matrix) // 4:
+			self.__resize(len(self._matrix) // 2)
+		self._index_removal()
+		self._changed()
 
 	def remove_edge(self, edge: tuple) -> bool:
 		node_from, node_to = edge
@@ -152,14 +391,53 @@ class AdjacencyMatrixGraph(Graph):
 		idx_from, idx_to = self._nodes_indexes[node_from], self._nodes_indexes[node_to]
 
 		# if the edge does not exists, return false
-		if self._matrix[idx_from, idx_to] is None:
+		if not self.__has_edges(np.s_[idx_from, idx_to]):
 			return False
+		self.__unshare()
 
 		# else remove the edge
-		self._matrix[idx_from, idx_to] = None
+		self._matrix[idx_from, idx_to] = self._no_edge
+		if self._mask is not None:
+			self._mask[idx_from, idx_to] = False
 
 		# remove the other side if the graph is undirected
 		if not self.is_directed:
-			self._matrix[idx_to, idx_from] = None
+			self._matrix[idx_to, idx_from] = self._no_edge
+			if self._mask is not None:
+				self._mask[idx_to, idx_from] = False
 
+		self._n_edges -= 1
+		self._index_removal()
+		self._changed()
 		return True
+
+	def snapshot(self) -> 'AdjacencyMatrixSnapshot':
+		"""
+		Builds a read-only view of the current state of the graph, that many threads can read without locks
+		while the graph keeps changing. It must be called by the thread that changes the graph.
+		The view shares the adjacent matrix and the node indexes with the graph, that copies them
+		before its next change (copy-on-write): building the view is O(1), the next change is O(n^2).
+		:return: the read-only view of the graph
+		"""
+		snapshot = AdjacencyMatrixSnapshot.__new__(AdjacencyMatrixSnapshot)
+		vars(snapshot).update(vars(self))
+		snapshot._matrix = self.__read_only(self._matrix)
+		snapshot._mask = self.__read_only(self._mask) if self._mask is not None else None
+		snapshot._components = self._components.copy() if self._components is not None else None
+		self._shared = True
+		return snapshot
+
+	@staticmethod
+	def __read_only(array: np.ndarray) -> np.ndarray:
+		"""
+		Returns a read-only view of the input array
+		"""
+		view = array.view()
+		view.flags.writeable = False
+		return view
+
+
+class AdjacencyMatrixSnapshot(ImmutableGraph, AdjacencyMatrixGraph):
+	"""
+	Read-only view of an AdjacencyMatrixGraph, built by AdjacencyMatrixGraph.snapshot.
+	"""
@@ -0,0 +1,291 @@
+import numpy as np
+import adt.graph.util.exceptions as exc
+from typing import FrozenSet, Iterable, Optional, Set, Union
+from adt.graph.util import sparse
+from adt.graph.core import Graph, ImmutableGraph, Node, Edge, WeightedEdge, _to_list
+
+
+class CSRGraph(ImmutableGraph):
+	"""
+	Immutable graph implementation with Compressed Sparse Row arrays.
+	The out-edges of the i-th node are the targets indices[indptr[i]:indptr[i + 1]],
+	with the costs stored at the same positions of weights.
+	"""
+	def __init__(self, nodes: Iterable[Node], indptr: np.ndarray, indices: np.ndarray, weights: Optional[np.ndarray] = None,
+				rev_indptr: Optional[np.ndarray] = None, rev_indices: Optional[np.ndarray] = None,
+				rev_weights: Optional[np.ndarray] = None, *, directed: bool = False, weighted: bool = False,
+				num_edges: Optional[int] = None):
+		"""
+		Instance initializer. Use CSRGraph.from_graph or Graph.freeze to build it from another graph.
+		:param nodes: the nodes of the graph, the position of a node is its index in the arrays
+		:param indptr: the offsets of the out-edges of every node, of length len(nodes) + 1
+		:param indices: the target node index of every out-edge
+		:param weights: the cost of every out-edge, required if the graph is weighted
+		:param rev_indptr: the offsets of the in-edges of every node, computed if not given and the graph is directed
+		:param rev_indices: the source node index of every in-edge
+		:param rev_weights: the cost of every in-edge
+		:param directed: true if is a directed graph, false otherwise
+		:param weighted: true if is a weighted graph, false otherwise
+		:param num_edges: the number of edges, if known. Otherwise it's counted when first needed,
+		since counting the edges of an undirected graph reads all its arrays
+		"""
+		super().__init__(directed=directed, weighted=weighted)
+		if weighted and weights is None:
+			raise AttributeError('A weighted graph requires the weights array')
+		# this variable contains the nodes in index order
+		self._nodes = list(nodes)
+		# this variable contains the node indexes
+		self._nodes_indexes = {node: i for i, node in enumerate(self._nodes)}
+		self._indptr = self.__read_only(indptr)
+		self._indices = self.__read_only(indices)
+		self._csr_weights = self.__read_only(weights) if weighted else None
+
+		# the incoming edges of an undirected graph are its outgoing edges
+		if directed and rev_indptr is None:
+			rev_indptr, rev_indices, rev_weights = self.__transpose()
+		self._rev_indptr = self.__read_only(rev_indptr) if directed else None
+		self._rev_indices = self.__read_only(rev_indices) if directed else None
+		self._rev_weights = self.__read_only(rev_weights) if directed and weighted else None
+
+		# an undirected edge is stored from both its ends, except for the self loops, so its count waits for num_edges
+		self._n_edges = len(self._indices) if directed and num_edges is None else num_edges
+
+	@classmethod
+	def from_graph(cls, graph: Graph) -> 'CSRGraph':
+		"""
+		Builds the compressed sparse row representation of a graph.
+		:param graph: the graph to freeze
+		:return: a new CSRGraph with the same vertices and edges of the input graph
+		"""
+		if isinstance(graph, CSRGraph):
+			return graph
+		nodes = list(graph.vertices)
+		nodes_indexes = {node: i for i, node in enumerate(nodes)}
+		indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+		targets, costs = [], []
+		for i, node in enumerate(nodes):
+			edges = graph.get_edges(node)
+			indptr[i + 1] = indptr[i] + len(edges)
+			for e in edges:
+				targets.append(nodes_indexes[e.n_to])
+				if graph.is_weighted:
+					costs.append(e.cost)
+		indices = np.array(targets, dtype=np.int64)
+		weights = cls._weights_array(costs) if graph.is_weighted else None
+		return cls(nodes, indptr, indices, weights, directed=graph.is_directed, weighted=graph.is_weighted)
+
+	@classmethod
+	def from_edge_array(cls, src: Iterable, dst: Iterable, weights: Optional[Iterable] = None, *, directed: bool = False,
+						weighted: Optional[bool] = None, **kwargs) -> 'CSRGraph':
+		"""
+		Builds the compressed sparse row arrays straight from the parallel arrays of the edges, sorting them by start node.
+		As in the other graphs, if an edge is repeated its last cost is kept.
+		"""
+		weighted = weights is not None if weighted is None else weighted
+		# read the iterables once: the nodes become Python objects, the weights stay an array if they are one
+		src, dst = _to_list(src), _to_list(dst)
+		if weights is not None and not isinstance(weights, np.ndarray):
+			weights = _to_list(weights)
+		if len(src) != len(dst) or (weighted and weights is not None and len(weights) != len(src)):
+			raise ValueError('src, dst and weights must have the same length')
+
+		# assign an index to every node in order of appearance
+		nodes_indexes = {}
+		sources = np.fromiter((nodes_indexes.setdefault(v, len(nodes_indexes)) for v in src), dtype=np.int64, count=len(src))
+		targets = np.fromiter((nodes_indexes.setdefault(v, len(nodes_indexes)) for v in dst), dtype=np.int64, count=len(dst))
+		n = len(nodes_indexes)
+		costs = cls._weights_array(weights) if weights is not None else np.zeros(len(src), dtype=np.int64)
+
+		# in undirected graphs each edge is followed by its reverse, so the last cost of an edge wins on both sides
+		if not directed:
+			sources, targets = np.stack((sources, targets), axis=1).ravel(), np.stack((targets, sources), axis=1).ravel()
+			costs = np.repeat(costs, 2)
+
+		# sort the edges by start and end node, then keep only the last copy of every edge
+		keys = sources * n + targets
+		order = np.argsort(keys, kind='stable')
+		keys = keys[order]
+		last = np.append(keys[1:] != keys[:-1], True) if len(keys) else np.array([], dtype=bool)
+		order = order[last]
+
+		indptr = np.zeros(n + 1, dtype=np.int64)
+		np.cumsum(np.bincount(sources[order], minlength=n), out=indptr[1:])
+		weights = cls._weights_array(costs[order]) if weighted else None
+		return cls(list(nodes_indexes), indptr, targets[order], weights, directed=directed, weighted=weighted, **kwargs)
+
+	@staticmethod
+	def _weights_array(costs: list) -> np.ndarray:
+		"""
+		Converts the edge costs into an array, falling back to an object array for non-numeric costs.
+		:param costs: the costs of the edges, as a list or an array
+		:return: the array of the costs
+		"""
+		weights = np.array(costs) if len(costs) else np.array([], dtype=np.float64)
+		if weights.dtype.kind not in 'biuf':
+			weights = np.array(costs, dtype=object)
+		return weights
+
+	@staticmethod
+	def __read_only(array: np.ndarray) -> np.ndarray:
+		"""
+		Returns a read-only view of the input array
+		"""
+		view = np.asarray(array).view()
+		view.flags.writeable = False
+		return view
+
+	def __transpose(self) -> tuple:
+		"""
+		Computes the in-edges arrays from the out-edges ones.
+		:return: the tuple (rev_indptr, rev_indices, rev_weights)
+		"""
+		n = len(self._nodes)
+		sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(self._indptr))
+		order = np.argsort(self._indices, kind='stable')
+		rev_indptr = np.zeros(n + 1, dtype=np.int64)
+		np.cumsum(np.bincount(self._indices, minlength=n), out=rev_indptr[1:])
+		rev_weights = self._csr_weights[order] if self._csr_weights is not None else None
+		return rev_indptr, sources[order], rev_weights
+
+	@property
+	def indptr(self) -> np.ndarray:
+		"""
+		Property
+		:return: a read-only view of the out-edges offsets
+		"""
+		return self._indptr
+
+	@property
+	def indices(self) -> np.ndarray:
+		"""
+		Property
+		:return: a read-only view of the out-edges target indexes
+		"""
+		return self._indices
+
+	@property
+	def weights(self) -> Optional[np.ndarray]:
+		"""
+		Property
+		:return: a read-only view of the out-edges costs, None if the graph is not weighted
+		"""
+		return self._csr_weights
+
+	@property
+	def rev_indptr(self) -> Optional[np.ndarray]:
+		"""
+		Property
+		:return: a read-only view of the in-edges offsets, None if the graph is undirected
+		"""
+		return self._rev_indptr
+
+	@property
+	def rev_indices(self) -> Optional[np.ndarray]:
+		"""
+		Property
+		:return: a read-only view of the in-edges source indexes, None if the graph is undirected
+		"""
+		return self._rev_indices
+
+	@property
+	def rev_weights(self) -> Optional[np.ndarray]:
+		"""
+		Property
+		:return: a read-only view of the in-edges costs, None if the graph is undirected or not weighted
+		"""
+		return self._rev_weights
+
+	@property
+	def nodes(self) -> list:
+		"""
+		Property
+		:return: a copy of the nodes in index order
+		"""
+		return list(self._nodes)
+
+	@property
+	def vertices(self) -> FrozenSet[Node]:
+		if self._vertices_view is None:
+			self._vertices_view = frozenset(self._nodes_indexes)
+		return self._vertices_view
+
+	@property
+	def edges(self) -> FrozenSet[Union[Edge, WeightedEdge]]:
+		if self._edges_view is None:
+			self._edges_view = frozenset().union(*(self.get_edges(node) for node in self._nodes))
+		return self._edges_view
+
+	@property
+	def num_edges(self) -> int:
+		if self._n_edges is None:
+			sources = np.repeat(np.arange(len(self._nodes), dtype=np.int64), np.diff(self._indptr))
+			self._n_edges = (len(self._indices) + int(np.count_nonzero(sources == self._indices))) // 2
+		return self._n_edges
+
+	def __len__(self) -> int:
+		return len(self._nodes)
+
+	def __contains__(self, node: object) -> bool:
+		return node in self._nodes_indexes
+
+	def index_of(self, node: Node) -> int:
+		"""
+		Gets the index of a node in the arrays of the graph.
+		:param node: the node to look for
+		:return: the index of the node
+		:raises NotInGraph: if the node is not in the graph
+		"""
+		if (idx := self._nodes_indexes.get(node)) is None:
+			raise exc.NotInGraph()
+		return idx
+
+	def to_sparse(self, fmt: str = 'csr') -> object:
+		"""
+		Exports the out-edges arrays as a sparse matrix, whose elements are the costs of the edges (1 if not weighted).
+		:param fmt: 'csr' for compressed sparse rows, 'coo' for coordinates
+		:return: a SciPy sparse matrix if SciPy is installed, otherwise a CSRMatrix or a COOMatrix of NumPy arrays
+		with the same attributes of the SciPy ones
+		:raises ValueError: if the format is not supported
+		"""
+		n = len(self._nodes)
+		rows = np.repeat(np.arange(n, dtype=np.int64), np.diff(self._indptr))
+		data = self._csr_weights if self.is_weighted else np.ones(len(self._indices), dtype=np.int64)
+		return sparse.make_sparse(rows, self._indices, data, (n, n), fmt)
+
+	def get_edges(self, node: Node) -> Set[Union[Edge, WeightedEdge]]:
+		idx = self.index_of(node)
+		return self.__slice_edges(node, self._indptr, self._indices, self._csr_weights, idx, outgoing=True)
+
+	def incoming_edges(self, node: Node) -> Set[Union[Edge, WeightedEdge]]:
+		# if the graph is undirected, this method is equals to get_edges
+		if not self.is_directed:
+			return self.get_edges(node)
+		idx = self.index_of(node)
+		return self.__slice_edges(node, self._rev_indptr, self._rev_indices, self._rev_weights, idx, outgoing=False)
+
+	def __slice_edges(self, node: Node, indptr: np.ndarray, indices: np.ndarray, weights: Optional[np.ndarray], idx: int,
+					outgoing: bool) -> Set[Union[Edge, WeightedEdge]]:
+		"""
+		Builds the edges of a node from its slice of the arrays
+		"""
+		lo, hi = indptr[idx], indptr[idx + 1]
+		others = [self._nodes[j] for j in indices[lo:hi].tolist()]
+		if self.is_weighted:
+			costs = weights[lo:hi].tolist()
+			if outgoing:
+				return {WeightedEdge(node, other, cost) for other, cost in zip(others, costs)}
+			return {WeightedEdge(other, node, cost) for other, cost in zip(others, costs)}
+		if outgoing:
+			return {Edge(node, other) for other in others}
+		return {Edge(other, node) for other in others}
+
+	def freeze(self) -> 'CSRGraph':
+		return self
+
+	def induced_subgraph(self, nodes: Iterable[Node]) -> 'CSRGraph':
+		return super().induced_subgraph(nodes).freeze()
+
+	def _empty_like(self) -> Graph:
+		# the subgraph is built in a mutable graph, then frozen
+		from adt.graph.implementations.adjacency_list import AdjacencyListGraph
+		return AdjacencyListGraph(directed=self.is_directed, weighted=self.is_weighted)
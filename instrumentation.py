@@ -0,0 +1,225 @@
+"""
+This module records how many times the graph operations and the functions of the package are called,
+how long they take and how many edges they return.
+The instrumentation is opt-in: outside of an instrument() block the graph classes are not modified
+and the instrumented functions only check that no recorder is active.
+"""
+import contextlib
+import functools
+import marshal
+import threading
+import time
+from adt.graph.core import Graph
+from typing import Callable, Dict, Iterator, List
+
+# the operations of the graphs that are timed, and those of them that return edges
+GRAPH_OPERATIONS = ('vertices', 'edges', 'get_edges', 'incoming_edges', 'add_vertex', 'add_edge', 'add_edges_from',
+                    'remove_vertex', 'remove_vertices_from', 'remove_edge')
+EDGE_OPERATIONS = ('edges', 'get_edges', 'incoming_edges')
+
+# the recorders of the active instrument() blocks
+_recorders: List['Recorder'] = []
+# the (class, attribute name, original attribute) replaced while any instrument() block is active
+_patched: list = []
+# the lock of the two lists above, since the blocks of different threads can overlap
+_lock = threading.Lock()
+
+
+class Recorder:
+    """
+    This class collects the calls of the instrumented operations.
+    It can be read with as_dict, or with the pstats module as if it was a cProfile.Profile: pstats.Stats(recorder).
+    Since the recorder doesn't track the callees, the internal time of a call is its cumulative time.
+    """
+    def __init__(self):
+        # for each operation: [number of calls, cumulative seconds, number of returned edges]
+        self._records = {}
+        # for each operation: the (file name, line number, function name) of its code
+        self._locations = {}
+        self.stats = {}
+
+    def record(self, name: str, location: tuple, seconds: float, n_edges: int) -> None:
+        """
+        Records a call of an operation.
+        :param name: the name of the operation
+        :param location: the (file name, line number, function name) of the code of the operation
+        :param seconds: the duration of the call
+        :param n_edges: the number of edges returned by the call
+        """
+        record = self._records.setdefault(name, [0, 0.0, 0])
+        record[0] += 1
+        record[1] += seconds
+        record[2] += n_edges
+        self._locations.setdefault(name, location)
+
+    def as_dict(self) -> Dict[str, dict]:
+        """
+        Exports the records.
+        :return: a dict that maps every called operation to a dict with its 'calls', 'seconds' and 'edges'
+        """
+        return {name: {'calls': calls, 'seconds': seconds, 'edges': n_edges}
+                for name, (calls, seconds, n_edges) in self._records.items()}
+
+    def create_stats(self) -> None:
+        """
+        Fills the stats attribute in the format of cProfile.Profile, used by pstats.Stats
+        """
+        self.stats = {self._locations[name]: (calls, calls, seconds, seconds, {})
+                      for name, (calls, seconds, _) in self._records.items()}
+
+    def dump_stats(self, path: str) -> None:
+        """
+        Writes the records to a file in the format of cProfile.Profile.dump_stats
+        :param path: the path of the file to write
+        """
+        self.create_stats()
+        with open(path, 'wb') as f:
+            marshal.dump(self.stats, f)
+
+    def print_stats(self, sort: str = 'cumulative') -> None:
+        """
+        Prints the records with pstats
+        :param sort: the pstats sort key
+        """
+        # pstats is imported only here, since it slows down the import of the package
+        import pstats
+        pstats.Stats(self).sort_stats(sort).print_stats()
+
+
+def _location(function: Callable, name: str) -> tuple:
+    """
+    Gets the location of a function in the format of the cProfile keys
+    """
+    code = getattr(function, '__code__', None)
+    if code is None:
+        return '~', 0, name
+    return code.co_filename, code.co_firstlineno, name
+
+
+def _record(name: str, location: tuple, seconds: float, result: object, returns_edges: bool) -> None:
+    """
+    Records a call to all the active recorders
+    """
+    n_edges = len(result) if returns_edges and result is not None else 0
+    for recorder in _recorders:
+        recorder.record(name, location, seconds, n_edges)
+
+
+def _timed(function: Callable, name: str, returns_edges: bool) -> Callable:
+    """
+    Wraps a function so that every call is recorded
+    """
+    location = _location(function, name)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start, result = time.perf_counter(), None
+        try:
+            result = function(*args, **kwargs)
+            return result
+        finally:
+            # the calls that raise are recorded too, without edges
+            _record(name, location, time.perf_counter() - start, result, returns_edges)
+    return wrapper
+
+
+def instrumented(function: Callable) -> Callable:
+    """
+    Decorator that records the calls of a function made inside an instrument() block.
+    Outside of the block the only cost is a check of the active recorders.
+    :param function: the function to instrument
+    :return: the instrumented function
+    """
+    timed = _timed(function, function.__name__, False)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _recorders:
+            return function(*args, **kwargs)
+        return timed(*args, **kwargs)
+    return wrapper
+
+
+def _graph_classes() -> List[type]:
+    """
+    Gets the Graph class and all its subclasses
+    """
+    classes, stack = [], [Graph]
+    while stack:
+        cls = stack.pop()
+        classes.append(cls)
+        stack.extend(cls.__subclasses__())
+    return classes
+
+
+def _patch_class(cls: type) -> list:
+    """
+    Replaces the operations of a graph class with recorded ones.
+    :param cls: the class to patch
+    :return: the list of (class, attribute name, original attribute) to restore
+    """
+    patched = []
+    for operation in GRAPH_OPERATIONS:
+        if operation not in vars(cls):
+            continue
+        original = vars(cls)[operation]
+        name = f'{cls.__name__}.{operation}'
+        returns_edges = operation in EDGE_OPERATIONS
+        if isinstance(original, property):
+            replacement = property(_timed(original.fget, name, returns_edges), original.fset, original.fdel)
+        elif callable(original):
+            replacement = _timed(original, name, returns_edges)
+        else:
+            continue
+        setattr(cls, operation, replacement)
+        patched.append((cls, operation, original))
+    return patched
+
+
+def _patch_graph_classes() -> list:
+    """
+    Replaces the operations of all the graph classes with recorded ones.
+    :return: the list of (class, attribute name, original attribute) to restore
+    """
+    return [patch for cls in _graph_classes() for patch in _patch_class(cls)]
+
+
+def _patch_new_class(cls: type) -> None:
+    """
+    Patches a graph class defined inside an instrument() block, e.g. a backend imported lazily
+    """
+    with _lock:
+        if _recorders:
+            _patched.extend(_patch_class(cls))
+
+
+Graph._subclass_hooks.append(_patch_new_class)
+
+
+@contextlib.contextmanager
+def instrument() -> Iterator[Recorder]:
+    """
+    Context manager that records the graph operations and the instrumented functions called inside its block.
+    The graph classes are patched when the first block starts and restored when the last active block ends,
+    even if the blocks of different threads overlap without nesting.
+    The graph classes defined inside the blocks, such as the backends imported lazily, are patched when they are defined.
+    Usage:
+        with instrument() as recorder:
+            shortest_path(graph, a, b)
+        print(recorder.as_dict())
+    :return: the recorder of the block
+    """
+    recorder = Recorder()
+    with _lock:
+        if not _recorders:
+            _patched.extend(_patch_graph_classes())
+        _recorders.append(recorder)
+    try:
+        yield recorder
+    finally:
+        with _lock:
+            _recorders.remove(recorder)
+            if not _recorders:
+                for cls, operation, original in reversed(_patched):
+                    setattr(cls, operation, original)
+                _patched.clear()
@@ -0,0 +1,124 @@
+"""
+This module contains shortest path functions that spread the work over a pool of processes.
+The graph is frozen once and its arrays are shared with the processes through shared memory, so they are not copied.
+"""
+import concurrent.futures
+import heapq
+import os
+import numpy as np
+from multiprocessing import shared_memory
+from adt.graph.core import Graph
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# the arrays of the graph attached by a worker process
+_shared_arrays = {}
+
+
+def multi_source_shortest_paths(graph: Graph, sources: Iterable[object],
+                                workers: Optional[int] = None) -> Dict[object, Dict[object, float]]:
+    """
+    This method uses Dijkstra algorithm to find the distances from many source nodes, one search per process at a time.
+    :param graph: the graph to inspect
+    :param sources: the nodes from where the searches start
+    :param workers: the number of processes, by default the number of CPUs. With 1 the searches run in this process.
+    :return: a dict that maps every source to the distances of the nodes reachable from it.
+    The unreachable nodes are not in the distances.
+    :raises AttributeError: if the graph is not weighted or it's undirected.
+    :raises KeyError: if the graph not contains a source node.
+    :raises ValueError: if the costs of the graph are not numbers.
+    """
+    if not graph.is_directed or not graph.is_weighted:
+        raise AttributeError('The graph must be directed and weighted')
+    sources = list(dict.fromkeys(sources))
+    for source in sources:
+        if source not in graph:
+            raise KeyError(f"The node {source=} is not in the graph")
+
+    csr = graph.freeze()
+    if csr.weights.dtype.kind not in 'biuf':
+        raise ValueError('The costs of the graph must be numbers')
+    arrays = {
+        'indptr': csr.indptr,
+        'indices': csr.indices,
+        'weights': csr.weights.astype(np.float64, copy=False),
+    }
+    indexes = [csr.index_of(source) for source in sources]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(sources) <= 1:
+        results = [_dijkstra(arrays, idx) for idx in indexes]
+    else:
+        results = _run_in_pool(arrays, indexes, workers)
+
+    nodes = csr.nodes
+    return {source: {nodes[i]: d for i, d in zip(reached, distances)}
+            for source, (reached, distances) in zip(sources, results)}
+
+
+def _run_in_pool(arrays: Dict[str, np.ndarray], indexes: List[int], workers: int) -> List[Tuple[list, list]]:
+    """
+    Runs the searches in a pool of processes that share the arrays of the graph.
+    :param arrays: the compressed sparse row arrays of the graph
+    :param indexes: the indexes of the source nodes
+    :param workers: the number of processes
+    :return: the result of the search of every source
+    """
+    blocks = []
+    try:
+        specs = {}
+        for name, array in arrays.items():
+            block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+            blocks.append(block)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+            specs[name] = (block.name, array.shape, array.dtype.str)
+        chunksize = max(1, len(indexes) // (4 * workers))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                                    initargs=(specs,)) as executor:
+            return list(executor.map(_shared_dijkstra, indexes, chunksize=chunksize))
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _attach(specs: Dict[str, tuple]) -> None:
+    """
+    Initializer of the worker processes, it attaches the shared arrays of the graph.
+    :param specs: for each array, the name of its shared memory block, its shape and its dtype
+    """
+    for name, (block_name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        # keep a reference to the block, otherwise its memory is released
+        _shared_arrays[name] = (block, np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf))
+
+
+def _shared_dijkstra(source: int) -> Tuple[list, list]:
+    """
+    Runs a search in a worker process, on the shared arrays
+    """
+    return _dijkstra({name: array for name, (_, array) in _shared_arrays.items()}, source)
+
+
+def _dijkstra(arrays: Dict[str, np.ndarray], source: int) -> Tuple[list, list]:
+    """
+    Binary-heap Dijkstra with lazy deletion on the compressed sparse row arrays of a graph.
+    :param arrays: the 'indptr', 'indices' and 'weights' arrays of the graph
+    :param source: the index of the source node
+    :return: a tuple (the indexes of the reached nodes, their distances)
+    """
+    indptr, indices, weights = arrays['indptr'], arrays['indices'], arrays['weights']
+    distances = {source: 0.0}
+    settled = set()
+    heap = [(0.0, source)]
+    while heap:
+        dist, u = heapq.heappop(heap)
+        if u in settled:
+            continue
+        settled.add(u)
+        lo, hi = indptr[u], indptr[u + 1]
+        for v, cost in zip(indices[lo:hi].tolist(), weights[lo:hi].tolist()):
+            alt_route = dist + cost
+            if alt_route < distances.get(v, float('inf')):
+                distances[v] = alt_route
+                heapq.heappush(heap, (alt_route, v))
+    return list(distances), list(distances.values())
@@ -0,0 +1,129 @@
+"""
+This module saves and loads graphs with a compact binary format.
+The file contains a fixed-size header, the node table and the compressed sparse row arrays of the graph,
+aligned so that they can be memory-mapped without copies.
+The node table is JSON if all the nodes are strings or numbers, otherwise it is pickled:
+loading a pickled table can run arbitrary code, so it's allowed only for trusted files.
+"""
+import json
+import pickle
+import struct
+import numpy as np
+from adt.graph.core import Graph
+from adt.graph.implementations.csr import CSRGraph
+
+MAGIC = b'ADTGRAPH'
+VERSION = 1
+
+# magic, version, flags, weights dtype, number of nodes, number of stored out-edges, number of edges
+# and the (offset, length) of the sections
+_HEADER = struct.Struct('<8sHH8sqqq14q')
+_SECTIONS = ('nodes', 'indptr', 'indices', 'weights', 'rev_indptr', 'rev_indices', 'rev_weights')
+_DIRECTED, _WEIGHTED, _PICKLED_NODES = 1, 2, 4
+_JSON_TYPES = (str, int, float, bool)
+_ALIGNMENT = 64
+_INDEX_DTYPE = np.dtype('<i8')
+
+
+def save(graph: Graph, path: str) -> None:
+    """
+    Saves a graph to a binary file. The graph is frozen first, if it's not a CSRGraph.
+    :param graph: the graph to save
+    :param path: the path of the file to write
+    :return: None
+    :raises ValueError: if the graph is weighted and its costs are not numbers
+    """
+    csr = graph.freeze()
+    weights_dtype = np.dtype('<f8')
+    if csr.is_weighted:
+        if csr.weights.dtype.kind not in 'biuf':
+            raise ValueError('Only graphs with numeric costs can be saved')
+        weights_dtype = csr.weights.dtype.newbyteorder('<')
+
+    nodes = csr.nodes
+    pickled = not all(type(node) in _JSON_TYPES for node in nodes)
+    sections = {
+        'nodes': pickle.dumps(nodes, protocol=pickle.HIGHEST_PROTOCOL) if pickled else json.dumps(nodes).encode(),
+        'indptr': csr.indptr.astype(_INDEX_DTYPE, copy=False),
+        'indices': csr.indices.astype(_INDEX_DTYPE, copy=False),
+        'weights': csr.weights.astype(weights_dtype, copy=False) if csr.is_weighted else None,
+        'rev_indptr': csr.rev_indptr.astype(_INDEX_DTYPE, copy=False) if csr.is_directed else None,
+        'rev_indices': csr.rev_indices.astype(_INDEX_DTYPE, copy=False) if csr.is_directed else None,
+        'rev_weights': csr.rev_weights.astype(weights_dtype, copy=False) if csr.is_directed and csr.is_weighted else None,
+    }
+
+    # compute the position of every section after the header
+    positions, offset = [], _align(_HEADER.size)
+    for name in _SECTIONS:
+        data = sections[name]
+        length = 0 if data is None else len(data) if isinstance(data, bytes) else data.nbytes
+        positions += [offset if length else 0, length]
+        offset = _align(offset + length)
+
+    flags = (_DIRECTED if csr.is_directed else 0) | (_WEIGHTED if csr.is_weighted else 0) | (_PICKLED_NODES if pickled else 0)
+    header = _HEADER.pack(MAGIC, VERSION, flags, weights_dtype.str.encode(), len(csr.nodes), len(csr.indices),
+                          csr.num_edges, *positions)
+    with open(path, 'wb') as f:
+        f.write(header)
+        for name, section_offset in zip(_SECTIONS, positions[::2]):
+            if section_offset:
+                f.write(b'\0' * (section_offset - f.tell()))
+                data = sections[name]
+                f.write(data if isinstance(data, bytes) else data.tobytes())
+
+
+def load(path: str, mmap: bool = True, allow_pickle: bool = False) -> CSRGraph:
+    """
+    Loads a graph saved with the function save.
+    Warning: a file whose nodes are not strings or numbers contains pickled nodes, and unpickling them can run
+    arbitrary code. Set allow_pickle only for files from a trusted source.
+    :param path: the path of the file to read
+    :param mmap: if True the arrays are memory-mapped from the file, so they are loaded lazily by the operating system
+    and their pages are shared between processes. Otherwise they are read in memory.
+    :param allow_pickle: if True the pickled nodes are loaded, otherwise they raise ValueError
+    :return: a read-only graph
+    :raises ValueError: if the file is not a graph file, it has an unsupported version
+    or it has pickled nodes and allow_pickle is False
+    """
+    with open(path, 'rb') as f:
+        header = f.read(_HEADER.size)
+        if len(header) != _HEADER.size or not header.startswith(MAGIC):
+            raise ValueError(f'{path} is not a graph file')
+        _, version, flags, weights_dtype, n_nodes, n_entries, n_edges, *positions = _HEADER.unpack(header)
+        if version != VERSION:
+            raise ValueError(f'Unsupported graph file version {version}')
+        pickled = bool(flags & _PICKLED_NODES)
+        if pickled and not allow_pickle:
+            raise ValueError(f'{path} contains pickled nodes, load it with allow_pickle=True only if it is trusted')
+        sections = dict(zip(_SECTIONS, zip(positions[::2], positions[1::2])))
+        nodes_offset, nodes_length = sections['nodes']
+        f.seek(nodes_offset)
+        data = f.read(nodes_length)
+        nodes = pickle.loads(data) if pickled else json.loads(data) if nodes_length else []
+
+    directed, weighted = bool(flags & _DIRECTED), bool(flags & _WEIGHTED)
+    weights_dtype = np.dtype(weights_dtype.rstrip(b'\0').decode())
+
+    def _array(name: str, dtype: np.dtype, count: int):
+        offset, length = sections[name]
+        if count == 0:
+            return np.zeros(0, dtype=dtype)
+        if mmap:
+            return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(count,))
+        return np.fromfile(path, dtype=dtype, count=count, offset=offset)
+
+    indptr = _array('indptr', _INDEX_DTYPE, n_nodes + 1)
+    indices = _array('indices', _INDEX_DTYPE, n_entries)
+    weights = _array('weights', weights_dtype, n_entries) if weighted else None
+    rev_indptr = _array('rev_indptr', _INDEX_DTYPE, n_nodes + 1) if directed else None
+    rev_indices = _array('rev_indices', _INDEX_DTYPE, n_entries) if directed else None
+    rev_weights = _array('rev_weights', weights_dtype, n_entries) if directed and weighted else None
+    return CSRGraph(nodes, indptr, indices, weights, rev_indptr, rev_indices, rev_weights, directed=directed,
+                    weighted=weighted, num_edges=n_edges)
+
+
+def _align(offset: int) -> int:
+    """
+    Rounds up an offset of the file to the alignment of the sections
+    """
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
@@ -0,0 +1,169 @@
+"""
+This module reads graphs from text files: CSV/TSV or whitespace separated edge lists, and DIMACS shortest path files.
+The files are read in blocks of lines, so the memory does not depend on the size of the file,
+and the edges are yielded in batches that can be loaded with Graph.add_edges_from.
+"""
+import csv
+import queue
+import threading
+from adt.graph.core import Graph, Node
+from typing import Callable, Dict, Iterator, List, Optional
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+# the marker of the end of the file in the prefetch queue
+_END = object()
+
+
+def read_edge_list(path: str, *, delimiter: Optional[str] = ',', weighted: bool = False, cost_type: Callable = float,
+                   comment: str = '#', skip_header: bool = False, nodes: Optional[Dict[str, object]] = None,
+                   node_factory: Callable[[str], object] = Node, block_size: int = DEFAULT_BLOCK_SIZE,
+                   prefetch: bool = False) -> Iterator[List[tuple]]:
+    """
+    Reads an edge list, where each line is: node_from, node_to and the cost if the graph is weighted.
+    :param path: the path of the file to read
+    :param delimiter: the separator of the fields, e.g. ',' or '\\t'. With None the fields are separated by whitespaces.
+    :param weighted: true if the lines have the cost of the edge
+    :param cost_type: the function that parses the costs
+    :param comment: the prefix of the lines to skip
+    :param skip_header: true if the first line is a header to skip
+    :param nodes: the dict that maps each label to its node, the new nodes are added to it
+    :param node_factory: the function that builds the node of a new label
+    :param block_size: the approximate number of bytes read at a time
+    :param prefetch: if True a thread reads the next block while the current one is parsed
+    :return: a generator of batches of edges (node_from, node_to) or (node_from, node_to, cost), one per block
+    :raises ValueError: if a line has too few fields
+    """
+    nodes = {} if nodes is None else nodes
+    first = True
+    for lines in _read_blocks(path, block_size, prefetch):
+        if first and skip_header:
+            lines = lines[1:]
+        first = False
+        rows = (line.split() for line in lines) if delimiter is None else csv.reader(lines, delimiter=delimiter)
+        edges = []
+        for row in rows:
+            if not row or row[0].startswith(comment):
+                continue
+            if len(row) < (3 if weighted else 2):
+                raise ValueError(f'Invalid edge list row: {row!r}')
+            node_from, node_to = _node(nodes, row[0].strip(), node_factory), _node(nodes, row[1].strip(), node_factory)
+            edges.append((node_from, node_to, cost_type(row[2])) if weighted else (node_from, node_to))
+        yield edges
+
+
+def read_dimacs(path: str, *, cost_type: Callable = int, nodes: Optional[Dict[int, object]] = None,
+                node_factory: Callable[[str], object] = Node, block_size: int = DEFAULT_BLOCK_SIZE,
+                prefetch: bool = False) -> Iterator[List[tuple]]:
+    """
+    Reads a DIMACS shortest path file (.gr), that describes a directed weighted graph with the lines:
+    'c <comment>', 'p sp <number of nodes> <number of edges>' and 'a <node_from> <node_to> <cost>'.
+    :param path: the path of the file to read
+    :param cost_type: the function that parses the costs
+    :param nodes: the dict that maps each node number to its node, the new nodes are added to it
+    :param node_factory: the function that builds the node of a new node number, from its decimal string.
+    With the default the labels of the nodes are strings, like in every other Node.
+    :param block_size: the approximate number of bytes read at a time
+    :param prefetch: if True a thread reads the next block while the current one is parsed
+    :return: a generator of batches of edges (node_from, node_to, cost), one per block
+    :raises ValueError: if a line is not valid
+    """
+    nodes = {} if nodes is None else nodes
+    for lines in _read_blocks(path, block_size, prefetch):
+        edges = []
+        for line in lines:
+            fields = line.split()
+            if not fields or fields[0] in ('c', 'p'):
+                continue
+            if fields[0] != 'a' or len(fields) != 4:
+                raise ValueError(f'Invalid DIMACS line: {line!r}')
+            edges.append((_node(nodes, int(fields[1]), node_factory, fields[1]),
+                          _node(nodes, int(fields[2]), node_factory, fields[2]), cost_type(fields[3])))
+        yield edges
+
+
+def load_edge_list(graph: Graph, path: str, **kwargs) -> dict:
+    """
+    Adds the edges of an edge list file to a graph, a batch at a time.
+    :param graph: the graph to fill
+    :param path: the path of the file to read
+    :param kwargs: the other arguments of read_edge_list
+    :return: the dict that maps each label to its node
+    """
+    nodes = kwargs.setdefault('nodes', {})
+    kwargs.setdefault('weighted', graph.is_weighted)
+    for edges in read_edge_list(path, **kwargs):
+        graph.add_edges_from(edges)
+    return nodes
+
+
+def load_dimacs(graph: Graph, path: str, **kwargs) -> dict:
+    """
+    Adds the edges of a DIMACS shortest path file to a graph, a batch at a time.
+    :param graph: the graph to fill, it should be directed and weighted
+    :param path: the path of the file to read
+    :param kwargs: the other arguments of read_dimacs
+    :return: the dict that maps each node number to its node
+    """
+    nodes = kwargs.setdefault('nodes', {})
+    for edges in read_dimacs(path, **kwargs):
+        graph.add_edges_from(edges)
+    return nodes
+
+
+def _node(nodes: dict, key: object, node_factory: Callable, label: object = None) -> object:
+    """
+    Gets the node of a key, building it the first time from its label (the key itself if not given)
+    """
+    node = nodes.get(key)
+    if node is None:
+        node = nodes[key] = node_factory(key if label is None else label)
+    return node
+
+
+def _read_blocks(path: str, block_size: int, prefetch: bool) -> Iterator[List[str]]:
+    """
+    Reads a text file in blocks of whole lines.
+    :param path: the path of the file to read
+    :param block_size: the approximate number of bytes of a block
+    :param prefetch: if True the blocks are read by another thread, at most two blocks ahead
+    :return: a generator of the blocks
+    """
+    if not prefetch:
+        with open(path, newline='') as f:
+            while lines := f.readlines(block_size):
+                yield lines
+        return
+
+    blocks = queue.Queue(maxsize=2)
+    stop = threading.Event()
+
+    def _put(item: object) -> None:
+        # wait for room in the queue, unless the consumer stopped
+        while not stop.is_set():
+            try:
+                blocks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def _reader() -> None:
+        try:
+            with open(path, newline='') as f:
+                while not stop.is_set() and (lines := f.readlines(block_size)):
+                    _put(lines)
+        except BaseException as e:
+            _put(e)
+        finally:
+            _put(_END)
+
+    thread = threading.Thread(target=_reader, name='graph-reader', daemon=True)
+    thread.start()
+    try:
+        while (item := blocks.get()) is not _END:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
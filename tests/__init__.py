@@ -0,0 +1,3 @@
+"""
+This package contains the tests of the package, run them with: python -m pytest adt/graph/tests
+"""
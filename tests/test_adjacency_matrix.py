@@ -0,0 +1,78 @@
+import unittest
+import numpy as np
+from adt.graph.implementations import AdjacencyMatrixGraph
+
+
+class CapacityTest(unittest.TestCase):
+    def test_bulk_add_allocates_exactly(self):
+        graph = AdjacencyMatrixGraph()
+        graph.add_vertex(*range(5000))
+        self.assertEqual(graph._matrix.shape, (5000, 5000))
+        graph = AdjacencyMatrixGraph.from_edge_array([1, 2, 3], [2, 3, 4])
+        self.assertEqual(graph._matrix.shape, (4, 4))
+
+    def test_single_adds_double(self):
+        graph = AdjacencyMatrixGraph()
+        for v in range(5):
+            graph.add_vertex(v)
+        self.assertEqual(graph._matrix.shape, (8, 8))
+
+    def test_remove_shrinks(self):
+        graph = AdjacencyMatrixGraph()
+        graph.add_vertex(*range(100))
+        graph.add_edge(98, 99)
+        for v in range(90):
+            graph.remove_vertex(v)
+        self.assertLess(len(graph._matrix), 50)
+        self.assertEqual(set(graph.vertices), set(range(90, 100)))
+        self.assertEqual({tuple(e) for e in graph.edges}, {(98, 99), (99, 98)})
+
+
+class MaskTest(unittest.TestCase):
+    def test_object_matrix_has_no_mask(self):
+        graph = AdjacencyMatrixGraph(directed=True, weighted=True)
+        graph.add_vertex(1, 2)
+        graph.add_edge(1, 2, cost=0)
+        self.assertIsNone(graph._mask)
+        self.assertEqual(graph.mask.tolist(), [[False, True], [False, False]])
+        self.assertTrue(graph.remove_edge((1, 2)))
+        self.assertEqual(graph.num_edges, 0)
+
+    def test_numeric_matrix_zero_cost(self):
+        graph = AdjacencyMatrixGraph(directed=True, weighted=True, dtype=np.int64)
+        graph.add_vertex(1, 2)
+        graph.add_edge(1, 2, cost=0)
+        self.assertEqual({tuple(e) for e in graph.edges}, {(1, 2, 0)})
+        graph.remove_vertex(1)
+        self.assertEqual((graph.num_edges, len(graph.edges)), (0, 0))
+
+    def test_float_matrix_uses_nan(self):
+        graph = AdjacencyMatrixGraph(directed=True, weighted=True, dtype=np.float64)
+        graph.add_vertex(1, 2, 3)
+        graph.add_edge(1, 2, cost=0.0)
+        graph.add_edges_from([(2, 3, -1.5)])
+        self.assertIsNone(graph._mask)
+        self.assertEqual(graph.mask.tolist(), [[False, True, False], [False, False, True], [False, False, False]])
+        self.assertEqual({tuple(e) for e in graph.edges}, {(1, 2, 0.0), (2, 3, -1.5)})
+        self.assertTrue(graph.remove_edge((1, 2)))
+        self.assertEqual(graph.num_edges, 1)
+
+    def test_unweighted_bool_matrix(self):
+        graph = AdjacencyMatrixGraph(dtype=np.bool_)
+        graph.add_vertex(*range(4))
+        graph.add_edges_from([(0, 1), (1, 2)])
+        graph.add_edge(3, 3)
+        self.assertIsNone(graph._mask)
+        self.assertEqual(graph._matrix.nbytes, 16)
+        self.assertEqual({tuple(e) for e in graph.edges}, {(0, 1), (1, 0), (1, 2), (2, 1), (3, 3)})
+        graph.remove_vertex(1)
+        self.assertEqual(graph.num_edges, 1)
+
+    def test_weighted_int_matrix_has_mask(self):
+        graph = AdjacencyMatrixGraph(weighted=True, dtype=np.int32)
+        graph.add_vertex(1)
+        self.assertIsNotNone(graph._mask)
+
+
+if __name__ == '__main__':
+    unittest.main()
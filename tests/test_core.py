@@ -0,0 +1,25 @@
+import pickle
+import unittest
+from adt.graph.core import SlottedNode
+
+Point = SlottedNode.schema('Point', 'x', 'y')
+
+
+class SlottedNodeTest(unittest.TestCase):
+    def test_schema_module(self):
+        self.assertEqual(Point.__module__, __name__)
+        self.assertEqual(SlottedNode.schema('Other', module='somewhere').__module__, 'somewhere')
+
+    def test_schema_pickle(self):
+        node = Point('a', x=1, y=2)
+        copy = pickle.loads(pickle.dumps(node))
+        self.assertIs(type(copy), Point)
+        self.assertEqual((copy.label, copy.x, copy.y), ('a', 1, 2))
+
+    def test_schema_no_dict(self):
+        with self.assertRaises(AttributeError):
+            Point('a').z = 0
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+import numpy as np
+from adt.graph.implementations import AdjacencyListGraph, CSRGraph
+
+
+class FromEdgeArrayTest(unittest.TestCase):
+    def test_generators(self):
+        graph = CSRGraph.from_edge_array(np.array([1]), np.array([2]), (w for w in [1.0]), directed=True)
+        self.assertEqual({tuple(e) for e in graph.edges}, {(1, 2, 1.0)})
+        graph = CSRGraph.from_edge_array((v for v in 'ab'), iter('bc'))
+        self.assertEqual(graph.num_edges, 2)
+
+    def test_same_as_base(self):
+        src, dst, weights = [1, 2, 2, 1], [2, 3, 3, 1], [5, 6, 7, 8]
+        for directed in (False, True):
+            csr = CSRGraph.from_edge_array(src, dst, weights, directed=directed)
+            expected = AdjacencyListGraph.from_edge_array(src, dst, weights, directed=directed)
+            self.assertEqual(csr.edges, expected.edges)
+            self.assertEqual(csr.num_edges, expected.num_edges)
+
+    def test_edges_counted_lazily(self):
+        graph = CSRGraph.from_edge_array([1, 2, 3], [2, 3, 3])
+        self.assertIsNone(graph._n_edges)
+        self.assertEqual(graph.num_edges, 3)
+        self.assertEqual(CSRGraph.from_edge_array([1, 2, 3], [2, 3, 3], num_edges=3)._n_edges, 3)
+
+    def test_lengths(self):
+        with self.assertRaises(ValueError):
+            CSRGraph.from_edge_array([1, 2], (v for v in [3]))
+
+
+if __name__ == '__main__':
+    unittest.main()
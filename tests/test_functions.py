@@ -0,0 +1,27 @@
+import math
+import unittest
+from adt.graph.functions import astar_path, bidirectional_shortest_path, shortest_path
+from adt.graph.implementations import AdjacencyListGraph
+
+
+class PointToPointTest(unittest.TestCase):
+    def setUp(self):
+        self.graph = AdjacencyListGraph(directed=True, weighted=True)
+        self.graph.add_edges_from([(1, 2, 1), (2, 3, 1), (1, 3, 5), (4, 1, 1)])
+
+    def test_same_results(self):
+        for start, end in [(1, 3), (1, 4), (4, 3), (3, 3), (1, 'missing')]:
+            expected = shortest_path(self.graph, start, end)
+            self.assertEqual(bidirectional_shortest_path(self.graph, start, end)[1], expected[1])
+            self.assertEqual(astar_path(self.graph, start, end)[1], expected[1])
+
+    def test_missing_end_node(self):
+        self.assertEqual(bidirectional_shortest_path(self.graph, 1, 'missing'), ([], math.inf))
+
+    def test_missing_start_node(self):
+        with self.assertRaises(KeyError):
+            bidirectional_shortest_path(self.graph, 'missing', 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+import adt.graph.util.exceptions as exc
+from adt.graph.implementations import AdjacencyListGraph
+from adt.graph.instrumentation import instrument
+
+
+class InstrumentTest(unittest.TestCase):
+    def test_overlapping_blocks(self):
+        graph = AdjacencyListGraph()
+        graph.add_vertex(1, 2)
+        first, second = instrument(), instrument()
+        ra = first.__enter__()
+        rb = second.__enter__()
+        first.__exit__(None, None, None)
+        graph.add_edge(1, 2)
+        second.__exit__(None, None, None)
+        self.assertEqual(ra.as_dict(), {})
+        self.assertEqual(rb.as_dict()['AdjacencyListGraph.add_edge']['calls'], 1)
+        self.assertNotIn('__wrapped__', dir(AdjacencyListGraph.add_edge))
+
+    def test_calls_that_raise(self):
+        graph = AdjacencyListGraph()
+        with instrument() as recorder:
+            with self.assertRaises(exc.NotInGraph):
+                graph.add_edge(1, 2)
+        self.assertEqual(recorder.as_dict()['AdjacencyListGraph.add_edge']['calls'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
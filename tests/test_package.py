@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+import unittest
+import adt.graph
+
+
+class PackageTest(unittest.TestCase):
+    def test_all_is_the_public_api(self):
+        for name in adt.graph.__all__:
+            self.assertTrue(hasattr(adt.graph, name), name)
+        for name in ('collections', 'heapq', 'math', 'Callable', 'instrumented', 'importlib', 'functions'):
+            self.assertNotIn(name, adt.graph.__all__)
+
+    @staticmethod
+    def run_script(script: str) -> str:
+        return subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True,
+                              env=dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))).stdout
+
+    def test_import_without_numpy(self):
+        output = self.run_script('import sys, adt.graph; print("numpy" in sys.modules)')
+        self.assertEqual(output.strip(), 'False')
+
+    def test_lazy_backend_is_instrumented(self):
+        script = '\n'.join([
+            'import adt.graph as g',
+            'from adt.graph.instrumentation import instrument',
+            'with instrument() as recorder:',
+            '    graph = g.AdjacencyMatrixGraph()',
+            '    graph.add_vertex(1, 2)',
+            '    graph.add_edge(1, 2)',
+            'print(sorted(recorder.as_dict()))',
+            'print(hasattr(g.AdjacencyMatrixGraph.add_edge, "__wrapped__"))',
+        ])
+        output = self.run_script(script).splitlines()
+        self.assertEqual(output, ["['AdjacencyMatrixGraph.add_edge', 'AdjacencyMatrixGraph.add_vertex']", 'False'])
+
+
+if __name__ == '__main__':
+    unittest.main()
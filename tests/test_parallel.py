@@ -0,0 +1,55 @@
+import random
+import unittest
+from adt.graph.functions import shortest_path_tree
+from adt.graph.implementations import AdjacencyListGraph, AdjacencyMatrixGraph
+from adt.graph.parallel import multi_source_shortest_paths
+from adt.graph.vectorized import all_pairs_shortest_paths
+
+
+def _random_graph(cls: type, rng: random.Random):
+    n = rng.randint(1, 15)
+    graph = cls(directed=True, weighted=True)
+    graph.add_vertex(*range(n))
+    graph.add_edges_from([(rng.randrange(n), rng.randrange(n), rng.randint(0, 9)) for _ in range(rng.randint(0, 40))])
+    return graph
+
+
+def _expected(graph, source) -> dict:
+    distances, _ = shortest_path_tree(graph, source)
+    return {node: distance for node, distance in distances.items() if distance != float('inf')}
+
+
+class MultiSourceTest(unittest.TestCase):
+    def test_same_as_shortest_path_tree(self):
+        rng = random.Random(15)
+        for _ in range(10):
+            graph = _random_graph(AdjacencyListGraph, rng)
+            sources = list(graph.vertices)
+            for workers in (1, 2):
+                results = multi_source_shortest_paths(graph, sources, workers=workers)
+                self.assertEqual(set(results), set(sources))
+                for source in sources:
+                    self.assertEqual(results[source], _expected(graph, source))
+
+    def test_pool_on_frozen_graph(self):
+        graph = _random_graph(AdjacencyListGraph, random.Random(3)).freeze()
+        sources = graph.nodes
+        results = multi_source_shortest_paths(graph, sources, workers=2)
+        for source in sources:
+            self.assertEqual(results[source], _expected(graph, source))
+
+
+class AllPairsTest(unittest.TestCase):
+    def test_same_as_shortest_path_tree(self):
+        rng = random.Random(16)
+        for _ in range(10):
+            graph = _random_graph(AdjacencyMatrixGraph, rng)
+            nodes, distances = all_pairs_shortest_paths(graph)
+            for i, source in enumerate(nodes):
+                expected = _expected(graph, source)
+                for j, node in enumerate(nodes):
+                    self.assertEqual(distances[i, j], expected.get(node, float('inf')))
+
+
+if __name__ == '__main__':
+    unittest.main()
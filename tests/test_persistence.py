@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from adt.graph.core import Node, SlottedNode
+from adt.graph.implementations import AdjacencyListGraph
+from adt.graph.persistence import load, save
+
+City = SlottedNode.schema('City', 'population')
+
+
+class PersistenceTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.graph')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def save_graph(self, nodes: list) -> AdjacencyListGraph:
+        graph = AdjacencyListGraph(directed=True, weighted=True)
+        graph.add_edges_from([(nodes[0], nodes[1], 1.5), (nodes[1], nodes[2], 2.0)])
+        save(graph, self.path)
+        return graph
+
+    def test_plain_labels_need_no_pickle(self):
+        graph = self.save_graph(['a', 'b', 3])
+        loaded = load(self.path)
+        self.assertEqual({tuple(e) for e in loaded.edges}, {tuple(e) for e in graph.edges})
+
+    def test_pickled_nodes_need_allow_pickle(self):
+        self.save_graph([Node('a'), Node('b'), Node('c')])
+        with self.assertRaises(ValueError):
+            load(self.path)
+        loaded = load(self.path, allow_pickle=True)
+        self.assertEqual(sorted(node.label for node in loaded.vertices), ['a', 'b', 'c'])
+
+    def test_schema_nodes(self):
+        self.save_graph([City('a', population=1), City('b', population=2), City('c', population=3)])
+        loaded = load(self.path, mmap=False, allow_pickle=True)
+        self.assertEqual(sorted((node.label, node.population) for node in loaded.vertices),
+                         [('a', 1), ('b', 2), ('c', 3)])
+        self.assertEqual(loaded.num_edges, 2)
+
+    def test_undirected_edge_count_is_stored(self):
+        graph = AdjacencyListGraph()
+        graph.add_edges_from([(1, 2), (2, 3), (3, 3)])
+        save(graph, self.path)
+        loaded = load(self.path)
+        self.assertEqual(loaded._n_edges, 3)
+        self.assertEqual(loaded.num_edges, graph.num_edges)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import tempfile
+import threading
+import unittest
+from adt.graph.implementations import AdjacencyListGraph
+from adt.graph.readers import load_dimacs, load_edge_list, read_dimacs, read_edge_list
+
+EDGE_LIST = 'from,to,cost\n# a comment\na,b,1.5\n\nb,c,2\nc,a,3\n'
+DIMACS = 'c a comment\np sp 3 3\na 1 2 7\na 2 3 8\nc another comment\na 3 1 9\n'
+
+
+def _labels(batches) -> list:
+    return [(str(e[0]), str(e[1])) + tuple(e[2:]) for edges in batches for e in edges]
+
+
+class ReadersTest(unittest.TestCase):
+    def setUp(self):
+        self.paths = []
+
+    def tearDown(self):
+        for path in self.paths:
+            os.remove(path)
+
+    def write(self, text: str) -> str:
+        fd, path = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'w', newline='') as f:
+            f.write(text)
+        self.paths.append(path)
+        return path
+
+    def test_edge_list_blocks(self):
+        path = self.write(EDGE_LIST)
+        expected = [('a', 'b', 1.5), ('b', 'c', 2.0), ('c', 'a', 3.0)]
+        for block_size in (1, 1 << 20):
+            for prefetch in (False, True):
+                with self.subTest(block_size=block_size, prefetch=prefetch):
+                    nodes = {}
+                    batches = list(read_edge_list(path, weighted=True, skip_header=True, nodes=nodes,
+                                                  block_size=block_size, prefetch=prefetch))
+                    self.assertEqual(_labels(batches), expected)
+                    self.assertEqual(sorted(nodes), ['a', 'b', 'c'])
+                    if block_size == 1:
+                        self.assertGreater(len(batches), len(expected))
+
+    def test_whitespace_delimiter(self):
+        path = self.write('1 2\n2\t3\n')
+        self.assertEqual(_labels(read_edge_list(path, delimiter=None, block_size=1)), [('1', '2'), ('2', '3')])
+
+    def test_short_row(self):
+        path = self.write('a,b\nc\n')
+        for prefetch in (False, True):
+            with self.assertRaises(ValueError):
+                list(read_edge_list(path, block_size=1, prefetch=prefetch))
+
+    def test_dimacs_blocks(self):
+        path = self.write(DIMACS)
+        for prefetch in (False, True):
+            with self.subTest(prefetch=prefetch):
+                nodes = {}
+                batches = list(read_dimacs(path, nodes=nodes, block_size=1, prefetch=prefetch))
+                self.assertEqual(_labels(batches), [('1', '2', 7), ('2', '3', 8), ('3', '1', 9)])
+                self.assertEqual(sorted(nodes), [1, 2, 3])
+                self.assertEqual(nodes[1].label, '1')
+
+    def test_invalid_dimacs_line(self):
+        path = self.write('p sp 2 1\ne 1 2 3\n')
+        with self.assertRaises(ValueError):
+            list(read_dimacs(path))
+
+    def test_load(self):
+        graph = AdjacencyListGraph(directed=True, weighted=True)
+        nodes = load_edge_list(graph, self.write(EDGE_LIST), skip_header=True, block_size=1)
+        self.assertEqual(graph.num_edges, 3)
+        self.assertEqual({tuple(e) for e in graph.get_edges(nodes['a'])}, {(nodes['a'], nodes['b'], 1.5)})
+        graph = AdjacencyListGraph(directed=True, weighted=True)
+        nodes = load_dimacs(graph, self.write(DIMACS), prefetch=True)
+        self.assertEqual((len(graph), graph.num_edges, sorted(nodes)), (3, 3, [1, 2, 3]))
+
+    def test_early_close(self):
+        path = self.write('a,b\n' * 100)
+        for prefetch in (False, True):
+            batches = read_edge_list(path, block_size=1, prefetch=prefetch)
+            self.assertEqual(len(next(batches)), 1)
+            batches.close()
+            self.assertNotIn('graph-reader', [thread.name for thread in threading.enumerate()])
+
+    def test_missing_file(self):
+        for prefetch in (False, True):
+            with self.assertRaises(FileNotFoundError):
+                list(read_edge_list(os.path.join(tempfile.gettempdir(), 'missing-graph.txt'), prefetch=prefetch))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import random
+import threading
+import unittest
+import numpy as np
+import adt.graph.util.exceptions as exc
+from adt.graph.functions import shortest_path
+from adt.graph.implementations import AdjacencyListGraph, AdjacencyMatrixGraph
+
+
+def _state(graph) -> tuple:
+    """
+    Gets everything a reader can see of a graph
+    """
+    return (frozenset(graph.vertices), frozenset(tuple(e) for e in graph.edges), graph.num_edges, len(graph),
+            {v: frozenset(tuple(e) for e in graph.get_edges(v)) for v in graph.vertices},
+            {v: frozenset(tuple(e) for e in graph.incoming_edges(v)) for v in graph.vertices})
+
+
+def _random_change(graph, rng: random.Random, n: int) -> None:
+    """
+    Applies a random change to a graph with nodes in range(n)
+    """
+    r, a, b = rng.random(), rng.randrange(n), rng.randrange(n)
+    if r < 0.2:
+        if a not in graph:
+            graph.add_vertex(a)
+    elif r < 0.45:
+        if a in graph and b in graph:
+            graph.add_edge(a, b, cost=rng.randint(1, 5))
+    elif r < 0.6:
+        graph.add_edges_from([(rng.randrange(n), rng.randrange(n), rng.randint(1, 5)) for _ in range(3)])
+    elif r < 0.7:
+        graph.remove_vertex(a)
+    elif r < 0.8:
+        graph.remove_vertices_from([a, b])
+    elif a in graph and b in graph:
+        graph.remove_edge((a, b))
+
+
+class SnapshotTest(unittest.TestCase):
+    def test_snapshots_never_change(self):
+        rng = random.Random(0)
+        for cls in (AdjacencyListGraph, AdjacencyMatrixGraph):
+            for directed in (False, True):
+                for weighted in (False, True):
+                    graph = cls(directed=directed, weighted=weighted)
+                    snapshots = []
+                    for step in range(300):
+                        _random_change(graph, rng, 12)
+                        if step % 7 == 0:
+                            snapshots.append((graph.snapshot(), _state(graph)))
+                    for snapshot, state in snapshots:
+                        self.assertEqual(_state(snapshot), state)
+
+    def test_snapshot_is_read_only(self):
+        for graph in (AdjacencyListGraph(), AdjacencyMatrixGraph(), AdjacencyListGraph().freeze()):
+            snapshot = graph.snapshot()
+            self.assertIs(snapshot.snapshot(), snapshot)
+            for change in (lambda: snapshot.add_vertex(1), lambda: snapshot.add_edge(1, 2),
+                           lambda: snapshot.add_edges_from([]), lambda: snapshot.remove_vertex(1),
+                           lambda: snapshot.remove_vertices_from([]), lambda: snapshot.remove_edge((1, 2))):
+                with self.assertRaises(exc.ReadOnlyGraph):
+                    change()
+
+    def test_matrix_is_copied_on_write(self):
+        graph = AdjacencyMatrixGraph()
+        graph.add_vertex(1, 2, 3)
+        graph.add_edge(1, 2)
+        snapshot = graph.snapshot()
+        self.assertTrue(np.shares_memory(snapshot._matrix, graph._matrix))
+        graph.add_edge(2, 3)
+        self.assertFalse(np.shares_memory(snapshot._matrix, graph._matrix))
+        self.assertEqual(snapshot.num_edges, 1)
+        self.assertFalse(snapshot._matrix.flags.writeable)
+
+    def test_connectivity_index_is_copied(self):
+        graph = AdjacencyListGraph()
+        graph.enable_connectivity_index()
+        graph.add_vertex(1, 2)
+        snapshot = graph.snapshot()
+        graph.add_edge(1, 2)
+        self.assertEqual(snapshot.connectivity_index.num_sets, 2)
+        self.assertEqual(graph.connectivity_index.num_sets, 1)
+
+    def test_concurrent_readers(self):
+        for cls in (AdjacencyListGraph, AdjacencyMatrixGraph):
+            with self.subTest(cls=cls.__name__):
+                self.check_concurrent_readers(cls(directed=True, weighted=True))
+
+    def check_concurrent_readers(self, graph) -> None:
+        graph.add_vertex(*range(200))
+        for v in range(199):
+            graph.add_edge(v, v + 1, cost=1)
+        snapshots, errors = [graph.snapshot()], []
+
+        def writer() -> None:
+            rng = random.Random(1)
+            for _ in range(100):
+                for _ in range(50):
+                    a, b = rng.randrange(200), rng.randrange(200)
+                    graph.add_edge(a, b, cost=rng.randint(1, 9))
+                    if rng.random() < 0.5:
+                        graph.remove_edge((a, b))
+                snapshots.append(graph.snapshot())
+
+        def reader() -> None:
+            try:
+                for _ in range(25):
+                    snapshot = snapshots[-1]
+                    state = _state(snapshot)
+                    shortest_path(snapshot, 0, 199)
+                    self.assertEqual(_state(snapshot), state)
+            except Exception as e:
+                errors.append(e)
+
+        writer_thread = threading.Thread(target=writer)
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        writer_thread.start()
+        for thread in readers:
+            thread.start()
+        for thread in readers + [writer_thread]:
+            thread.join()
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import random
+import unittest
+import numpy as np
+from unittest import mock
+from adt.graph.implementations import AdjacencyMatrixGraph
+from adt.graph.util import sparse
+
+
+def _edges(graph) -> set:
+    return {tuple(e) for e in graph.edges}
+
+
+class SparseTest(unittest.TestCase):
+    def check_round_trip(self):
+        rng = random.Random(23)
+        for directed in (False, True):
+            for weighted in (False, True):
+                for _ in range(10):
+                    n = rng.randint(1, 10)
+                    graph = AdjacencyMatrixGraph(directed=directed, weighted=weighted)
+                    graph.add_vertex(*range(n))
+                    graph.add_edges_from([(rng.randrange(n), rng.randrange(n), rng.randint(1, 9))
+                                          for _ in range(rng.randint(0, 25))])
+                    for source in (graph, graph.freeze()):
+                        for fmt in sparse.FORMATS:
+                            matrix = source.to_sparse(fmt)
+                            copy = AdjacencyMatrixGraph.from_sparse(matrix, source.nodes, directed=directed,
+                                                                    weighted=weighted)
+                            self.assertEqual(_edges(copy), _edges(graph))
+                            self.assertEqual(copy.num_edges, graph.num_edges)
+
+    def test_round_trip_numpy(self):
+        with mock.patch.object(sparse, 'scipy_sparse', None):
+            self.check_round_trip()
+
+    @unittest.skipIf(sparse.scipy_sparse is None, 'SciPy is not installed')
+    def test_round_trip_scipy(self):
+        self.check_round_trip()
+
+    def test_conversions(self):
+        dense = np.array([[0, 2, 0], [0, 0, 0], [3, 0, 4]])
+        with mock.patch.object(sparse, 'scipy_sparse', None):
+            coo = sparse.to_coo(dense)
+            csr = sparse.to_csr(coo)
+            self.assertEqual(csr.indptr.tolist(), [0, 1, 1, 3])
+            self.assertEqual(csr.indices.tolist(), [1, 0, 2])
+            self.assertEqual(csr.data.tolist(), [2, 3, 4])
+            back = sparse.to_coo(csr)
+            self.assertEqual(sorted(zip(back.row.tolist(), back.col.tolist(), back.data.tolist())),
+                             sorted(zip(coo.row.tolist(), coo.col.tolist(), coo.data.tolist())))
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            sparse.make_sparse(np.zeros(0), np.zeros(0), np.zeros(0), (0, 0), 'dok')
+        with self.assertRaises(TypeError):
+            sparse.to_coo([[1]])
+        with self.assertRaises(ValueError):
+            AdjacencyMatrixGraph.from_sparse(np.zeros((2, 3)))
+
+
+if __name__ == '__main__':
+    unittest.main()
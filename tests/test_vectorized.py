@@ -0,0 +1,114 @@
+import collections
+import itertools
+import random
+import unittest
+from unittest import mock
+from adt.graph.implementations import AdjacencyMatrixGraph
+from adt.graph.util import sparse
+from adt.graph.vectorized import bfs_levels, degree_vector, pagerank, triangle_count
+
+
+def _random_graphs(rng: random.Random, directed: bool, weighted: bool = False):
+    """
+    Yields random matrix graphs and their frozen copies, with self loops and repeated edges
+    """
+    for _ in range(10):
+        n = rng.randint(1, 12)
+        graph = AdjacencyMatrixGraph(directed=directed, weighted=weighted)
+        graph.add_vertex(*range(n))
+        graph.add_edges_from([(rng.randrange(n), rng.randrange(n), rng.randint(1, 9)) for _ in range(rng.randint(0, 30))])
+        yield graph
+        yield graph.freeze()
+
+
+class DegreeVectorTest(unittest.TestCase):
+    def test_same_as_edges(self):
+        rng = random.Random(19)
+        for directed in (False, True):
+            for graph in _random_graphs(rng, directed, weighted=True):
+                for direction, edges_of in (('out', graph.get_edges), ('in', graph.incoming_edges)):
+                    nodes, degrees = degree_vector(graph, direction)
+                    self.assertEqual(degrees.tolist(), [len(edges_of(node)) for node in nodes])
+                    nodes, degrees = degree_vector(graph, direction, weighted=True)
+                    self.assertEqual(degrees.tolist(), [sum(e.cost for e in edges_of(node)) for node in nodes])
+
+    def test_invalid_direction(self):
+        with self.assertRaises(ValueError):
+            degree_vector(AdjacencyMatrixGraph(), 'both')
+
+
+class PagerankTest(unittest.TestCase):
+    @staticmethod
+    def brute_force(graph, nodes: list, alpha: float) -> list:
+        n = len(nodes)
+        ranks = {node: 1 / n for node in nodes}
+        for _ in range(1000):
+            dangling = sum(ranks[node] for node in nodes if not graph.get_edges(node))
+            new_ranks = {node: (alpha * dangling + 1 - alpha) / n for node in nodes}
+            for node in nodes:
+                edges = graph.get_edges(node)
+                for e in edges:
+                    new_ranks[e.n_to] += alpha * ranks[node] / len(edges)
+            ranks = new_ranks
+        return [ranks[node] for node in nodes]
+
+    def test_same_as_brute_force(self):
+        rng = random.Random(20)
+        for graph in _random_graphs(rng, directed=True):
+            nodes, ranks = pagerank(graph, tol=1e-12, max_iter=1000)
+            self.assertAlmostEqual(ranks.sum(), 1)
+            for rank, expected in zip(ranks.tolist(), self.brute_force(graph, nodes, 0.85)):
+                self.assertAlmostEqual(rank, expected)
+
+    def test_empty_graph(self):
+        nodes, ranks = pagerank(AdjacencyMatrixGraph())
+        self.assertEqual((nodes, len(ranks)), ([], 0))
+
+
+class BfsLevelsTest(unittest.TestCase):
+    def test_same_as_brute_force(self):
+        rng = random.Random(21)
+        for directed in (False, True):
+            for graph in _random_graphs(rng, directed):
+                source = rng.choice(sorted(graph.vertices))
+                expected, queue = {source: 0}, collections.deque([source])
+                while queue:
+                    node = queue.popleft()
+                    for e in graph.get_edges(node):
+                        if e.n_to not in expected:
+                            expected[e.n_to] = expected[node] + 1
+                            queue.append(e.n_to)
+                nodes, levels = bfs_levels(graph, source)
+                self.assertEqual(levels.tolist(), [expected.get(node, -1) for node in nodes])
+
+    def test_missing_source(self):
+        with self.assertRaises(KeyError):
+            bfs_levels(AdjacencyMatrixGraph(), 1)
+
+
+class TriangleCountTest(unittest.TestCase):
+    @staticmethod
+    def brute_force(graph) -> int:
+        adjacent = {(e.n_from, e.n_to) for e in graph.edges}
+        return sum(all(pair in adjacent for pair in itertools.combinations(triple, 2))
+                   for triple in itertools.combinations(graph.vertices, 3))
+
+    def check(self, seed: int):
+        for graph in _random_graphs(random.Random(seed), directed=False):
+            self.assertEqual(triangle_count(graph), self.brute_force(graph))
+
+    def test_numpy(self):
+        with mock.patch.object(sparse, 'scipy_sparse', None):
+            self.check(22)
+
+    @unittest.skipIf(sparse.scipy_sparse is None, 'SciPy is not installed')
+    def test_scipy(self):
+        self.check(22)
+
+    def test_directed_graph(self):
+        with self.assertRaises(AttributeError):
+            triangle_count(AdjacencyMatrixGraph(directed=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+This module contains iterative graph traversals, that don't use recursion and so work on graphs of any depth.
+"""
+import collections
+from adt.graph.core import Graph
+from typing import Dict, Iterator
+
+
+def bfs(graph: Graph, source: object) -> Iterator[object]:
+    """
+    Breadth-first visit of the nodes reachable from a source node.
+    :param graph: the graph to visit
+    :param source: the node from where the visit starts
+    :return: a generator of the visited nodes, in breadth-first order. The first node is the source.
+    """
+    discovered = {source}
+    frontier = collections.deque([source])
+    while frontier:
+        u = frontier.popleft()
+        yield u
+        for e in graph.get_edges(u):
+            if e.n_to not in discovered:
+                discovered.add(e.n_to)
+                frontier.append(e.n_to)
+
+
+def dfs(graph: Graph, source: object) -> Iterator[object]:
+    """
+    Depth-first visit of the nodes reachable from a source node.
+    :param graph: the graph to visit
+    :param source: the node from where the visit starts
+    :return: a generator of the visited nodes, in depth-first pre-order. The first node is the source.
+    """
+    discovered = {source}
+    yield source
+    # the stack keeps the edges still to follow of every node of the current path
+    stack = [iter(graph.get_edges(source))]
+    while stack:
+        for e in stack[-1]:
+            if e.n_to not in discovered:
+                discovered.add(e.n_to)
+                yield e.n_to
+                stack.append(iter(graph.get_edges(e.n_to)))
+                break
+        else:
+            stack.pop()
+
+
+def connected_components(graph: Graph) -> Dict[object, int]:
+    """
+    Finds the connected components of an undirected graph.
+    :param graph: the input graph
+    :return: a dict that maps every node to the label of its component. The labels are 0, 1, 2, ...
+    :raises AttributeError: if the graph is directed.
+    """
+    if graph.is_directed:
+        raise AttributeError('The graph must be undirected.')
+    labels = {}
+    n_components = 0
+    for v in graph.vertices:
+        if v not in labels:
+            for u in bfs(graph, v):
+                labels[u] = n_components
+            n_components += 1
+    return labels
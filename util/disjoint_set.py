@@ -0,0 +1,95 @@
+from typing import Iterable
+
+
+class DisjointSet:
+	"""
+	This class is a union-find of hashable items, with path compression and union by rank,
+	so a sequence of operations costs almost O(1) per operation.
+	"""
+	def __init__(self, items: Iterable = ()):
+		"""
+		Instance initializer
+		:param items: the items to add, each of them in its own set
+		"""
+		# for each item, its parent in the tree of its set. The root of a tree is its own parent
+		self._parent = {}
+		# for each root, an upper bound of the height of its tree
+		self._rank = {}
+		# the number of disjoint sets
+		self._n_sets = 0
+		for item in items:
+			self.add(item)
+
+	@property
+	def num_sets(self) -> int:
+		"""
+		Property
+		:return: the number of disjoint sets
+		"""
+		return self._n_sets
+
+	def __len__(self) -> int:
+		return len(self._parent)
+
+	def __contains__(self, item: object) -> bool:
+		return item in self._parent
+
+	def add(self, item: object) -> None:
+		"""
+		Adds an item in a new set, if it's not already in the structure.
+		:param item: the item to add
+		"""
+		if item not in self._parent:
+			self._parent[item] = item
+			self._rank[item] = 0
+			self._n_sets += 1
+
+	def find(self, item: object) -> object:
+		"""
+		Finds the representative of the set of an item, and links all the items on the way directly to it.
+		:param item: the item to look for
+		:return: the representative item of the set
+		:raises KeyError: if the item is not in the structure
+		"""
+		parent = self._parent
+		root = item
+		while parent[root] != root:
+			root = parent[root]
+		while parent[item] != root:
+			parent[item], item = root, parent[item]
+		return root
+
+	def union(self, item_a: object, item_b: object) -> bool:
+		"""
+		Merges the sets of two items, hanging the lower tree under the higher one.
+		:param item_a: an item of the first set
+		:param item_b: an item of the second set
+		:return: True if the sets were disjoint, False if the items were already in the same set
+		:raises KeyError: if an item is not in the structure
+		"""
+		root_a, root_b = self.find(item_a), self.find(item_b)
+		if root_a == root_b:
+			return False
+		if self._rank[root_a] < self._rank[root_b]:
+			root_a, root_b = root_b, root_a
+		self._parent[root_b] = root_a
+		if self._rank[root_a] == self._rank[root_b]:
+			self._rank[root_a] += 1
+		del self._rank[root_b]
+		self._n_sets -= 1
+		return True
+
+	def connected(self, item_a: object, item_b: object) -> bool:
+		"""
+		Checks if two items are in the same set.
+		:raises KeyError: if an item is not in the structure
+		"""
+		return self.find(item_a) == self.find(item_b)
+
+	def copy(self) -> 'DisjointSet':
+		"""
+		:return: an independent copy of the structure
+		"""
+		other = DisjointSet()
+		other._parent, other._rank, other._n_sets = dict(self._parent), dict(self._rank), self._n_sets
+		return other
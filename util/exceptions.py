@@ -10,3 +10,10 @@ class AlreadyInGraph(Exception):
 	Trowed when an element is alrady in the graph
 	"""
 	pass
+
+
+class ReadOnlyGraph(Exception):
+	"""
+	Trowed when a read-only graph is modified
+	"""
+	pass
@@ -0,0 +1,79 @@
+"""
+This module contains minimal sparse matrix containers, used when SciPy is not installed.
+They have the same attributes of the SciPy matrices of the same format, so the code can use both of them.
+"""
+import collections
+import numpy as np
+
+try:
+	import scipy.sparse as scipy_sparse
+except ImportError:
+	scipy_sparse = None
+
+CSRMatrix = collections.namedtuple('CSRMatrix', 'indptr indices data shape')
+COOMatrix = collections.namedtuple('COOMatrix', 'row col data shape')
+
+FORMATS = ('csr', 'coo')
+
+
+def make_sparse(row: np.ndarray, col: np.ndarray, data: np.ndarray, shape: tuple, fmt: str = 'csr') -> object:
+	"""
+	Builds a sparse matrix from its coordinates, sorted by row.
+	:param row: the row of every element
+	:param col: the column of every element
+	:param data: the value of every element
+	:param shape: the shape of the matrix
+	:param fmt: 'csr' or 'coo'
+	:return: a SciPy sparse matrix if SciPy is installed, a CSRMatrix or a COOMatrix otherwise
+	:raises ValueError: if the format is not supported
+	"""
+	if fmt not in FORMATS:
+		raise ValueError(f'Unsupported sparse format {fmt!r}, use one of {FORMATS}')
+	if scipy_sparse is not None:
+		coo = scipy_sparse.coo_matrix((data, (row, col)), shape=shape)
+		return coo.tocsr() if fmt == 'csr' else coo
+	if fmt == 'coo':
+		return COOMatrix(row, col, data, shape)
+	indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+	np.cumsum(np.bincount(row, minlength=shape[0]), out=indptr[1:])
+	return CSRMatrix(indptr, col, data, shape)
+
+
+def to_coo(matrix: object) -> COOMatrix:
+	"""
+	Gets the coordinates of the elements of a sparse matrix.
+	:param matrix: a SciPy sparse matrix, a CSRMatrix, a COOMatrix or a dense NumPy matrix
+	:return: the COOMatrix of the matrix
+	:raises TypeError: if the matrix type is not supported
+	"""
+	if isinstance(matrix, COOMatrix):
+		return matrix
+	if isinstance(matrix, CSRMatrix):
+		row = np.repeat(np.arange(matrix.shape[0], dtype=np.int64), np.diff(matrix.indptr))
+		return COOMatrix(row, np.asarray(matrix.indices), np.asarray(matrix.data), matrix.shape)
+	if scipy_sparse is not None and scipy_sparse.issparse(matrix):
+		coo = matrix.tocoo()
+		return COOMatrix(coo.row, coo.col, coo.data, coo.shape)
+	if isinstance(matrix, np.ndarray) and matrix.ndim == 2:
+		row, col = np.nonzero(matrix)
+		return COOMatrix(row, col, matrix[row, col], matrix.shape)
+	raise TypeError(f'Unsupported matrix type {type(matrix).__name__}')
+
+
+def to_csr(matrix: object) -> CSRMatrix:
+	"""
+	Gets the compressed sparse row arrays of a sparse matrix.
+	:param matrix: a SciPy sparse matrix, a CSRMatrix, a COOMatrix or a dense NumPy matrix
+	:return: the CSRMatrix of the matrix
+	:raises TypeError: if the matrix type is not supported
+	"""
+	if isinstance(matrix, CSRMatrix):
+		return matrix
+	if scipy_sparse is not None and scipy_sparse.issparse(matrix):
+		csr = matrix.tocsr()
+		return CSRMatrix(csr.indptr, csr.indices, csr.data, csr.shape)
+	row, col, data, shape = to_coo(matrix)
+	order = np.argsort(row, kind='stable')
+	indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+	np.cumsum(np.bincount(row, minlength=shape[0]), out=indptr[1:])
+	return CSRMatrix(indptr, np.asarray(col)[order], np.asarray(data)[order], shape)
@@ -0,0 +1,169 @@
+"""
+This module contains the algorithms that work on the whole adjacency matrix at once with NumPy.
+The sparse algorithms run on the compressed sparse rows of an AdjacencyMatrixGraph or a CSRGraph,
+each of their steps is a sparse matrix-vector product written with NumPy, so SciPy is not required.
+"""
+import numpy as np
+from adt.graph.core import Node
+from adt.graph.implementations.adjacency_matrix import AdjacencyMatrixGraph
+from adt.graph.implementations.csr import CSRGraph
+from adt.graph.util import sparse
+from typing import Tuple, Union
+
+
+def all_pairs_shortest_paths(graph: AdjacencyMatrixGraph) -> Tuple[list, np.ndarray]:
+    """
+    This method uses Floyd–Warshall algorithm to find the distances between all the pairs of nodes.
+    Each of its n steps relaxes the whole matrix of distances with a single NumPy operation.
+    :param graph: the graph to inspect, if it's not weighted every edge costs 1
+    :return: a tuple representing:
+    (the nodes, the matrix of the distances where the element [i, j] is the distance from the i-th node to the j-th one).
+    The distance of an unreachable node is inf.
+    :raises TypeError: if the graph is not an AdjacencyMatrixGraph.
+    :raises ValueError: if the costs of the graph are not numbers.
+    """
+    if not isinstance(graph, AdjacencyMatrixGraph):
+        raise TypeError('The graph must be an AdjacencyMatrixGraph')
+    mask = graph.mask
+    distances = np.full(mask.shape, np.inf)
+    try:
+        distances[mask] = graph.matrix[mask].astype(np.float64) if graph.is_weighted else 1
+    except (TypeError, ValueError) as e:
+        raise ValueError('The costs of the graph must be numbers') from e
+    np.fill_diagonal(distances, np.minimum(distances.diagonal(), 0))
+
+    for k in range(len(distances)):
+        np.minimum(distances, distances[:, k, np.newaxis] + distances[np.newaxis, k, :], out=distances)
+    return graph.nodes, distances
+
+
+def _adjacency(graph: Union[AdjacencyMatrixGraph, CSRGraph]) -> Tuple[list, sparse.CSRMatrix, np.ndarray]:
+    """
+    Gets the nodes of a graph, its sparse adjacency matrix and the row of every element of the matrix
+    """
+    if not isinstance(graph, (AdjacencyMatrixGraph, CSRGraph)):
+        raise TypeError('The graph must be an AdjacencyMatrixGraph or a CSRGraph')
+    a = sparse.to_csr(graph.to_sparse('csr'))
+    rows = np.repeat(np.arange(a.shape[0], dtype=np.int64), np.diff(a.indptr))
+    return graph.nodes, a, rows
+
+
+def degree_vector(graph: Union[AdjacencyMatrixGraph, CSRGraph], direction: str = 'out',
+                  weighted: bool = False) -> Tuple[list, np.ndarray]:
+    """
+    Computes the degree of all the nodes at once.
+    :param graph: the graph to inspect
+    :param direction: 'out' to count the outgoing edges, 'in' to count the incoming ones. They are equal if the graph is undirected.
+    :param weighted: if True the costs of the edges are summed instead of counted
+    :return: a tuple representing: (the nodes, the array of their degrees)
+    :raises TypeError: if the graph is not an AdjacencyMatrixGraph or a CSRGraph.
+    :raises ValueError: if the direction is not valid.
+    """
+    if direction not in ('out', 'in'):
+        raise ValueError("The direction must be 'out' or 'in'")
+    nodes, a, rows = _adjacency(graph)
+    weights = np.asarray(a.data, dtype=np.float64) if weighted and graph.is_weighted else None
+    ends = rows if direction == 'out' else a.indices
+    degrees = np.bincount(ends, weights=weights, minlength=a.shape[0])
+    return nodes, degrees
+
+
+def pagerank(graph: Union[AdjacencyMatrixGraph, CSRGraph], alpha: float = 0.85, tol: float = 1e-6,
+             max_iter: int = 100) -> Tuple[list, np.ndarray]:
+    """
+    This method computes the PageRank of the nodes by power iteration, every edge has the same weight.
+    The rank of the nodes without outgoing edges is spread over all the nodes.
+    :param graph: the graph to inspect
+    :param alpha: the damping factor
+    :param tol: the iteration stops when the sum of the changes of the ranks is less than tol times the number of nodes
+    :param max_iter: the maximum number of iterations, the last ranks are returned even if they did not converge
+    :return: a tuple representing: (the nodes, the array of their ranks, that sum to 1)
+    :raises TypeError: if the graph is not an AdjacencyMatrixGraph or a CSRGraph.
+    """
+    nodes, a, rows = _adjacency(graph)
+    n = a.shape[0]
+    if not n:
+        return nodes, np.zeros(0)
+    out_degrees = np.bincount(rows, minlength=n).astype(np.float64)
+    dangling = out_degrees == 0
+    inv_degrees = np.divide(1.0, out_degrees, out=np.zeros(n), where=~dangling)
+
+    ranks = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        previous = ranks
+        # every node gives its rank to its successors in equal parts: a transposed matrix-vector product
+        ranks = alpha * np.bincount(a.indices, weights=(previous * inv_degrees)[rows], minlength=n)
+        ranks += (alpha * previous[dangling].sum() + 1 - alpha) / n
+        if np.abs(ranks - previous).sum() < n * tol:
+            break
+    return nodes, ranks
+
+
+def bfs_levels(graph: Union[AdjacencyMatrixGraph, CSRGraph], source: Node) -> Tuple[list, np.ndarray]:
+    """
+    This method computes the BFS level of every node, expanding the whole frontier at each step
+    with a boolean sparse matrix-vector product. Each step costs O(E), so it fits graphs with a small diameter.
+    :param graph: the graph to inspect
+    :param source: the node of level 0
+    :return: a tuple representing: (the nodes, the array of their number of edges from the source, -1 if unreachable)
+    :raises TypeError: if the graph is not an AdjacencyMatrixGraph or a CSRGraph.
+    :raises KeyError: if the graph not contains source.
+    """
+    nodes, a, rows = _adjacency(graph)
+    if source not in graph:
+        raise KeyError(f"The node {source=} is not in the graph")
+    n = a.shape[0]
+    levels = np.full(n, -1, dtype=np.int64)
+    frontier = np.zeros(n, dtype=bool)
+    frontier[nodes.index(source)] = True
+    levels[frontier] = 0
+    level = 0
+    while frontier.any():
+        level += 1
+        # the successors of the frontier are the targets of the edges whose row is in the frontier
+        reached = np.zeros(n, dtype=bool)
+        reached[a.indices[frontier[rows]]] = True
+        frontier = reached & (levels < 0)
+        levels[frontier] = level
+    return nodes, levels
+
+
+def triangle_count(graph: Union[AdjacencyMatrixGraph, CSRGraph]) -> int:
+    """
+    This method counts the triangles of an undirected graph, the self loops are ignored.
+    Each edge is oriented from the node of lower degree to the one of higher degree, so every triangle is found once,
+    closing the paths of two oriented edges. With SciPy the paths are counted with a sparse matrix product.
+    :param graph: the graph to inspect
+    :return: the number of triangles
+    :raises TypeError: if the graph is not an AdjacencyMatrixGraph or a CSRGraph.
+    :raises AttributeError: if the graph is directed.
+    """
+    if graph.is_directed:
+        raise AttributeError('The graph must be undirected')
+    _, a, rows = _adjacency(graph)
+    n = a.shape[0]
+    # rank the nodes by degree, then keep each edge once, from the lower rank to the higher one
+    rank = np.empty(n, dtype=np.int64)
+    rank[np.lexsort((np.arange(n), np.diff(a.indptr)))] = np.arange(n)
+    u, v = rank[rows], rank[a.indices]
+    forward = u < v
+    u, v = u[forward], v[forward]
+
+    if sparse.scipy_sparse is not None:
+        upper = sparse.scipy_sparse.csr_matrix((np.ones(len(u), dtype=np.int64), (u, v)), shape=(n, n))
+        return int((upper @ upper).multiply(upper).sum())
+
+    # sort the oriented edges, so the successors of every node are contiguous
+    keys = np.sort(u * n + v)
+    u, v = keys // n, keys % n
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(u, minlength=n), out=indptr[1:])
+    # for every edge (u, v), every successor w of v closes a triangle if the edge (u, w) exists
+    counts = indptr[v + 1] - indptr[v]
+    edge = np.repeat(np.arange(len(u)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    w = v[indptr[v[edge]] + offsets]
+    wanted = u[edge] * n + w
+    found = np.searchsorted(keys, wanted)
+    found[found == len(keys)] = 0
+    return int(np.count_nonzero(keys[found] == wanted)) if len(keys) else 0